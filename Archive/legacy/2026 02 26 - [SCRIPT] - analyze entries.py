@@ -9,64 +9,69 @@ Also checks for nesting (community objects inside other community objects).
 Reports the line number in the HTML file where each matching entry starts.
 """
 
-import json
+import io
+import mmap
 import re
 import sys
+from collections import namedtuple
+
+from data_loader import load_data
+
+try:
+    import ijson
+    IJSON_AVAILABLE = True
+except ImportError:
+    IJSON_AVAILABLE = False
 
 HTML_FILE = "/Users/a.princealbert3/Desktop/TRACKER APP/tckc-threat-tracker-v10-Jan30final.html"
 
 COMMUNITY_FIELDS = {"people", "places", "practices", "treasures"}
 
+WordCounts = namedtuple("WordCounts", ["people", "places", "practices", "treasures", "total"])
 
-def extract_data_json(html_text):
-    """Extract the DATA JSON object from the HTML file."""
-    # Find 'const DATA = {' and extract everything until the closing '};'
-    match = re.search(r'const DATA = (\{)', html_text)
-    if not match:
-        print("ERROR: Could not find 'const DATA = {' in the file.")
-        sys.exit(1)
-
-    start = match.start(1)
-    # We need to find the matching closing brace
-    depth = 0
-    i = start
-    while i < len(html_text):
-        ch = html_text[i]
-        if ch == '{':
-            depth += 1
-        elif ch == '}':
-            depth -= 1
-            if depth == 0:
-                end = i + 1
-                break
-        elif ch == '"':
-            # Skip string contents to avoid counting braces inside strings
-            i += 1
-            while i < len(html_text):
-                if html_text[i] == '\\':
-                    i += 2  # skip escaped character
-                    continue
-                if html_text[i] == '"':
-                    break
-                i += 1
-        i += 1
-    else:
-        print("ERROR: Could not find matching closing brace for DATA object.")
-        sys.exit(1)
+AnalyzedEntry = namedtuple("AnalyzedEntry", [
+    "id", "category", "date", "title", "comm_keys", "community_data",
+    "min_words", "nesting", "all_communities_recursive", "line_number",
+])
 
-    json_str = html_text[start:end]
+# Matches the "i": "entry_id" key that opens each entry (on a single line)
+ENTRY_ID_RE = re.compile(rb'"i": "([^"\n]+)"')
 
-    # The JSON may contain HTML in strings (like <span> tags), which is fine for json.loads
-    try:
-        data = json.loads(json_str)
-    except json.JSONDecodeError as e:
-        print(f"ERROR: Failed to parse DATA JSON: {e}")
-        # Try to show context around error
-        pos = e.pos if hasattr(e, 'pos') else 0
-        print(f"Context: ...{json_str[max(0,pos-100):pos+100]}...")
-        sys.exit(1)
 
-    return data
+def collect_entries(html_bytes, categories, keep):
+    """
+    Return (category, entry) pairs for the entries of DATA's categories that
+    pass keep(entry), category by category in the order given.
+
+    With ijson installed, each category's entries are streamed out of the
+    DATA literal one at a time and only the kept ones are held, so the rest
+    of DATA is never built in memory. Otherwise, or if streaming fails, the
+    whole object comes from data_loader.load_data.
+    """
+    if IJSON_AVAILABLE:
+        marker = b'const DATA = '
+        start = html_bytes.find(marker + b'{')
+        end = html_bytes.find(b'};\n', start) + 1 if start != -1 else 0
+        if end:
+            raw = html_bytes[start + len(marker):end]
+            try:
+                return [
+                    (cat, entry)
+                    for cat in categories
+                    for entry in ijson.items(io.BytesIO(raw), f'{cat}.item', use_float=True)
+                    if isinstance(entry, dict) and keep(entry)
+                ]
+            except ijson.JSONError:
+                pass  # the full parse below reports what is wrong
+
+    data = load_data(HTML_FILE)
+    found = []
+    for cat in categories:
+        entries = data.get(cat, [])
+        if not isinstance(entries, list):
+            continue
+        found.extend((cat, entry) for entry in entries if keep(entry))
+    return found
 
 
 def count_words(text):
@@ -93,7 +98,7 @@ def find_community_subobjects(impact_obj):
     for key, value in impact_obj.items():
         if isinstance(value, dict):
             # Check if this dict has community fields
-            has_community_fields = bool(set(value.keys()) & COMMUNITY_FIELDS)
+            has_community_fields = any(field in value for field in COMMUNITY_FIELDS)
             if has_community_fields:
                 communities.append((key, value))
 
@@ -104,19 +109,28 @@ def find_all_communities_recursive(obj, path=""):
     """
     Recursively find all community sub-objects (dicts with people/places/practices/treasures).
     Returns list of (path, community_dict) where path shows nesting.
+
+    Walks the tree with an explicit stack of (items iterator, path) pairs
+    rather than Python recursion, visiting dicts in the same order.
     """
     results = []
     if not isinstance(obj, dict):
         return results
 
-    for key, value in obj.items():
-        if isinstance(value, dict):
-            has_community_fields = bool(set(value.keys()) & COMMUNITY_FIELDS)
-            current_path = f"{path}.{key}" if path else key
-            if has_community_fields:
-                results.append((current_path, value))
-            # Recurse into the value to find nested communities
-            results.extend(find_all_communities_recursive(value, current_path))
+    stack = [(iter(obj.items()), path)]
+    while stack:
+        items, parent_path = stack[-1]
+        for key, value in items:
+            if isinstance(value, dict):
+                has_community_fields = any(field in value for field in COMMUNITY_FIELDS)
+                current_path = f"{parent_path}.{key}" if parent_path else key
+                if has_community_fields:
+                    results.append((current_path, value))
+                # Descend into the value to find nested communities
+                stack.append((iter(value.items()), current_path))
+                break
+        else:
+            stack.pop()
 
     return results
 
@@ -130,24 +144,29 @@ def check_nesting(impact_obj):
     if not isinstance(impact_obj, dict):
         return nesting_info
 
-    def _check(obj, parent_path="", parent_is_community=False):
-        if not isinstance(obj, dict):
-            return
-        for key, value in obj.items():
-            if key in COMMUNITY_FIELDS:
-                continue  # skip the text fields themselves
-            if isinstance(value, dict):
-                has_community_fields = bool(set(value.keys()) & COMMUNITY_FIELDS)
-                current_path = f"{parent_path}.{key}" if parent_path else key
-                if has_community_fields and parent_is_community:
-                    nesting_info.append(f"{current_path} nested inside {parent_path}")
-                _check(value, current_path, has_community_fields)
-
     for key, value in impact_obj.items():
-        if isinstance(value, dict):
-            has_community_fields = bool(set(value.keys()) & COMMUNITY_FIELDS)
-            if has_community_fields:
-                _check(value, key, True)
+        if not isinstance(value, dict):
+            continue
+        if not any(field in value for field in COMMUNITY_FIELDS):
+            continue
+
+        # Depth-first walk below this community, with an explicit stack of
+        # (items iterator, path, is_community) entries instead of recursion
+        stack = [(iter(value.items()), key, True)]
+        while stack:
+            items, parent_path, parent_is_community = stack[-1]
+            for child_key, child in items:
+                if child_key in COMMUNITY_FIELDS:
+                    continue  # skip the text fields themselves
+                if isinstance(child, dict):
+                    has_community_fields = any(field in child for field in COMMUNITY_FIELDS)
+                    current_path = f"{parent_path}.{child_key}" if parent_path else child_key
+                    if has_community_fields and parent_is_community:
+                        nesting_info.append(f"{current_path} nested inside {parent_path}")
+                    stack.append((iter(child.items()), current_path, has_community_fields))
+                    break
+            else:
+                stack.pop()
 
     return nesting_info
 
@@ -155,105 +174,105 @@ def check_nesting(impact_obj):
 def get_community_word_counts(community_dict):
     """
     Get word counts for people, places, practices, treasures in a community dict.
-    Returns dict of field -> word_count and total.
+    Returns a WordCounts tuple of the four field counts and their total.
     """
-    counts = {}
-    total = 0
-    for field in ["people", "places", "practices", "treasures"]:
-        wc = count_words(community_dict.get(field, ""))
-        counts[field] = wc
-        total += wc
-    counts["total"] = total
-    return counts
+    get = community_dict.get
+    people = count_words(get("people", ""))
+    places = count_words(get("places", ""))
+    practices = count_words(get("practices", ""))
+    treasures = count_words(get("treasures", ""))
+    return WordCounts(people, places, practices, treasures,
+                      people + places + practices + treasures)
 
 
-def count_top_level_communities(impact_obj):
+def scan_impact(impact_obj):
     """
-    Count the number of top-level community sub-objects in I.
+    Return the keys of the top-level community sub-objects in I if there are
+    exactly 3 of them, else None.
     A top-level community sub-object is a direct child of I that is a dict
     with at least one of people/places/practices/treasures keys.
+    Stops at the fourth community, since the entry is rejected either way.
     """
-    count = 0
-    communities = []
     if not isinstance(impact_obj, dict):
-        return 0, []
+        return None
 
+    communities = []
     for key, value in impact_obj.items():
-        if isinstance(value, dict):
-            has_community_fields = bool(set(value.keys()) & COMMUNITY_FIELDS)
-            if has_community_fields:
-                count += 1
-                communities.append(key)
+        if isinstance(value, dict) and any(field in value for field in COMMUNITY_FIELDS):
+            communities.append(key)
+            if len(communities) > 3:
+                return None
 
-    return count, communities
+    return communities if len(communities) == 3 else None
 
 
-def find_entry_line_numbers(html_lines, entry_ids):
+def find_entry_line_numbers(html_bytes, entry_ids):
     """
     Find the line number where each entry starts (the line with "i": "entry_id").
+    One regex pass over the raw (mmap) file finds each id's byte offset; line
+    numbers come from counting newlines between consecutive matches, so the
+    file is never split into a list of lines.
     Returns dict of entry_id -> line_number.
     """
     result = {}
-    for line_no, line in enumerate(html_lines, 1):
-        for eid in entry_ids:
-            # Look for "i": "eid" pattern
-            if f'"i": "{eid}"' in line:
-                # The entry object starts a few lines before (the opening {)
-                # Search backwards for the opening brace
-                for back in range(line_no - 1, max(0, line_no - 5), -1):
-                    stripped = html_lines[back - 1].strip()
-                    if stripped == '{':
-                        result[eid] = back
-                        break
-                else:
-                    result[eid] = line_no
+    wanted = set(entry_ids)
+    line_no, counted_to = 1, 0
+    for match in ENTRY_ID_RE.finditer(html_bytes):
+        eid = match.group(1).decode('utf-8')
+        if eid not in wanted:
+            continue
+        offset = match.start()
+        line_no += html_bytes[counted_to:offset].count(b'\n')
+        counted_to = offset
+        # The entry object starts a few lines before (the opening {)
+        # Search backwards for the opening brace
+        result[eid] = line_no
+        line_start = html_bytes.rfind(b'\n', 0, offset) + 1
+        for back in range(1, min(4, line_no - 1) + 1):
+            prev_start = html_bytes.rfind(b'\n', 0, line_start - 1) + 1
+            if html_bytes[prev_start:line_start - 1].strip() == b'{':
+                result[eid] = line_no - back
+                break
+            line_start = prev_start
     return result
 
 
 def main():
     print(f"Reading file: {HTML_FILE}")
-    with open(HTML_FILE, 'r', encoding='utf-8') as f:
-        html_text = f.read()
-
-    html_lines = html_text.split('\n')
-
-    print("Extracting DATA JSON object...")
-    data = extract_data_json(html_text)
-
-    # Categories to scan
-    categories = ["executive_actions", "agency_actions", "legislation", "litigation",
-                   "other_domestic", "international"]
-
-    # Collect all entries from April-June 2025
-    target_months = {"2025-04", "2025-05", "2025-06"}
-    apr_jun_entries = []
-
-    for cat in categories:
-        entries = data.get(cat, [])
-        if not isinstance(entries, list):
-            continue
-        for entry in entries:
-            date = entry.get("d", "")
-            if date[:7] in target_months:
-                apr_jun_entries.append((cat, entry))
-
-    print(f"\nTotal entries with dates in April-June 2025: {len(apr_jun_entries)}")
-
-    # Filter to entries with exactly 3 top-level community sub-objects in I
-    three_community_entries = []
-    for cat, entry in apr_jun_entries:
-        impact = entry.get("I")
-        if not impact or not isinstance(impact, dict):
-            continue
-        count, comm_keys = count_top_level_communities(impact)
-        if count == 3:
-            three_community_entries.append((cat, entry, comm_keys))
-
-    print(f"Entries with exactly 3 community sub-objects in I: {len(three_community_entries)}")
-
-    # Find line numbers for all matching entries
-    all_ids = [entry["i"] for _, entry, _ in three_community_entries]
-    line_numbers = find_entry_line_numbers(html_lines, all_ids)
+    # Map the file instead of reading it into a str: the DATA locator and the
+    # line-number scan work on bytes, and only the DATA slice is decoded
+    with open(HTML_FILE, 'rb') as f, \
+            mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as html_bytes:
+        # Categories to scan
+        categories = ["executive_actions", "agency_actions", "legislation", "litigation",
+                       "other_domestic", "international"]
+
+        # Collect all entries from April-June 2025. Dates are ISO YYYY-MM-DD, so
+        # the month is just the first 7 characters; no datetime parsing needed
+        target_months = {"2025-04", "2025-05", "2025-06"}
+
+        print("Extracting DATA JSON object...")
+        apr_jun_entries = collect_entries(
+            html_bytes, categories, lambda entry: entry.get("d", "")[:7] in target_months
+        )
+
+        print(f"\nTotal entries with dates in April-June 2025: {len(apr_jun_entries)}")
+
+        # Filter to entries with exactly 3 top-level community sub-objects in I
+        three_community_entries = []
+        for cat, entry in apr_jun_entries:
+            impact = entry.get("I")
+            if not impact or not isinstance(impact, dict):
+                continue
+            comm_keys = scan_impact(impact)
+            if comm_keys:
+                three_community_entries.append((cat, entry, comm_keys))
+
+        print(f"Entries with exactly 3 community sub-objects in I: {len(three_community_entries)}")
+
+        # Find line numbers for all matching entries
+        all_ids = [entry["i"] for _, entry, _ in three_community_entries]
+        line_numbers = find_entry_line_numbers(html_bytes, all_ids)
 
     # Check word counts and nesting
     print("\n" + "=" * 100)
@@ -261,7 +280,9 @@ def main():
     print("Filtering to those where ANY community section has < 250 words total")
     print("=" * 100)
 
-    matching_entries = []
+    # Word-count every 3-community entry once; the detail report below and
+    # the summary table both read from this list
+    analyzed_entries = []
 
     for cat, entry, comm_keys in three_community_entries:
         impact = entry.get("I", {})
@@ -269,14 +290,13 @@ def main():
 
         # Get word counts for each top-level community
         community_data = []
-        has_under_250 = False
+        min_words = float('inf')
 
         for key in comm_keys:
             comm_dict = impact[key]
             wc = get_community_word_counts(comm_dict)
             community_data.append((key, wc))
-            if wc["total"] < 250:
-                has_under_250 = True
+            min_words = min(min_words, wc.total)
 
         # Check for nesting
         nesting = check_nesting(impact)
@@ -284,79 +304,79 @@ def main():
         # Also find ALL communities recursively (for complete picture)
         all_communities = find_all_communities_recursive(impact)
 
-        if has_under_250:
-            matching_entries.append({
-                "id": entry_id,
-                "category": cat,
-                "date": entry.get("d"),
-                "title": entry.get("s", entry.get("n", "")),
-                "comm_keys": comm_keys,
-                "community_data": community_data,
-                "nesting": nesting,
-                "all_communities_recursive": all_communities,
-                "line_number": line_numbers.get(entry_id, "unknown"),
-            })
-
-    print(f"\nMatching entries (3 communities, at least one < 250 words): {len(matching_entries)}")
-    print()
+        analyzed_entries.append(AnalyzedEntry(
+            id=entry_id,
+            category=cat,
+            date=entry.get("d"),
+            title=entry.get("s", entry.get("n", "")),
+            comm_keys=comm_keys,
+            community_data=community_data,
+            min_words=min_words,
+            nesting=nesting,
+            all_communities_recursive=all_communities,
+            line_number=line_numbers.get(entry_id, "unknown"),
+        ))
+
+    matching_entries = [m for m in analyzed_entries if m.min_words < 250]
+
+    # Collect the report lines and write them to stdout in one go
+    out = []
+    out.append(f"\nMatching entries (3 communities, at least one < 250 words): {len(matching_entries)}")
+    out.append("")
 
     for idx, m in enumerate(matching_entries, 1):
-        print(f"\n{'─' * 100}")
-        print(f"ENTRY #{idx}")
-        print(f"  ID:           {m['id']}")
-        print(f"  Category:     {m['category']}")
-        print(f"  Date:         {m['date']}")
-        print(f"  Title:        {m['title']}")
-        print(f"  Line Number:  {m['line_number']}")
-        print(f"  Top-level community keys: {m['comm_keys']}")
-        print()
-
-        print(f"  COMMUNITY WORD COUNTS (top-level):")
-        for key, wc in m['community_data']:
-            flag = " *** UNDER 250 ***" if wc['total'] < 250 else ""
-            print(f"    {key}:")
-            print(f"      people:    {wc['people']:>4} words")
-            print(f"      places:    {wc['places']:>4} words")
-            print(f"      practices: {wc['practices']:>4} words")
-            print(f"      treasures: {wc['treasures']:>4} words")
-            print(f"      TOTAL:     {wc['total']:>4} words{flag}")
-            print()
-
-        print(f"  NESTING: {'Yes' if m['nesting'] else 'No'}")
-        if m['nesting']:
-            for n in m['nesting']:
-                print(f"    -> {n}")
+        out.append(f"\n{'─' * 100}")
+        out.append(f"ENTRY #{idx}")
+        out.append(f"  ID:           {m.id}")
+        out.append(f"  Category:     {m.category}")
+        out.append(f"  Date:         {m.date}")
+        out.append(f"  Title:        {m.title}")
+        out.append(f"  Line Number:  {m.line_number}")
+        out.append(f"  Top-level community keys: {m.comm_keys}")
+        out.append("")
+
+        out.append(f"  COMMUNITY WORD COUNTS (top-level):")
+        for key, wc in m.community_data:
+            flag = " *** UNDER 250 ***" if wc.total < 250 else ""
+            out.append(f"    {key}:")
+            out.append(f"      people:    {wc.people:>4} words")
+            out.append(f"      places:    {wc.places:>4} words")
+            out.append(f"      practices: {wc.practices:>4} words")
+            out.append(f"      treasures: {wc.treasures:>4} words")
+            out.append(f"      TOTAL:     {wc.total:>4} words{flag}")
+            out.append("")
+
+        out.append(f"  NESTING: {'Yes' if m.nesting else 'No'}")
+        if m.nesting:
+            for n in m.nesting:
+                out.append(f"    -> {n}")
 
         # Show all communities found recursively
-        all_recursive = m['all_communities_recursive']
-        if len(all_recursive) > len(m['comm_keys']):
-            print(f"\n  ALL COMMUNITIES (recursive, including nested):")
+        all_recursive = m.all_communities_recursive
+        if len(all_recursive) > len(m.comm_keys):
+            out.append(f"\n  ALL COMMUNITIES (recursive, including nested):")
             for path, comm_dict in all_recursive:
                 wc = get_community_word_counts(comm_dict)
                 depth = path.count('.')
                 indent = "    " + "  " * depth
-                print(f"{indent}{path}: {wc['total']} words (p:{wc['people']} pl:{wc['places']} pr:{wc['practices']} t:{wc['treasures']})")
+                out.append(f"{indent}{path}: {wc.total} words (p:{wc.people} pl:{wc.places} pr:{wc.practices} t:{wc.treasures})")
 
     # Also print summary of ALL 3-community entries (even those without < 250)
-    print(f"\n\n{'=' * 100}")
-    print("SUMMARY: ALL ENTRIES WITH EXACTLY 3 COMMUNITIES (April-June 2025)")
-    print(f"{'=' * 100}")
-    print(f"{'ID':<30} {'Date':<12} {'Line':<8} {'Communities':<60} {'Min Words':<10} {'<250?'}")
-    print("-" * 130)
-    for cat, entry, comm_keys in three_community_entries:
-        impact = entry.get("I", {})
-        entry_id = entry.get("i", "unknown")
-        date = entry.get("d", "")
-        ln = line_numbers.get(entry_id, "?")
-
-        min_words = float('inf')
-        for key in comm_keys:
-            wc = get_community_word_counts(impact[key])
-            min_words = min(min_words, wc["total"])
-
-        keys_str = ", ".join(comm_keys)
+    out.append(f"\n\n{'=' * 100}")
+    out.append("SUMMARY: ALL ENTRIES WITH EXACTLY 3 COMMUNITIES (April-June 2025)")
+    out.append(f"{'=' * 100}")
+    out.append(f"{'ID':<30} {'Date':<12} {'Line':<8} {'Communities':<60} {'Min Words':<10} {'<250?'}")
+    out.append("-" * 130)
+    for m in analyzed_entries:
+        date = m.date or ""
+        ln = line_numbers.get(m.id, "?")
+        min_words = m.min_words
+
+        keys_str = ", ".join(m.comm_keys)
         flag = "YES" if min_words < 250 else "no"
-        print(f"{entry_id:<30} {date:<12} {str(ln):<8} {keys_str:<60} {min_words:<10} {flag}")
+        out.append(f"{m.id:<30} {date:<12} {str(ln):<8} {keys_str:<60} {min_words:<10} {flag}")
+
+    sys.stdout.write('\n'.join(out) + '\n')
 
 
 if __name__ == "__main__":
@@ -4,19 +4,22 @@ Analyze database entries from October 2025 onward to find community impact secti
 with fewer than 250 words total across all 4P fields.
 """
 
-import json
 import re
-from datetime import datetime
+import sys
+
+from data_loader import load_data
+
+TAG_RE = re.compile(r'<[^>]+>')
 
 def count_words(text):
     """Count words in a text string."""
     if not text or not isinstance(text, str):
         return 0
-    # Remove HTML tags
-    text = re.sub(r'<[^>]+>', '', text)
+    # Remove HTML tags, skipping the regex pass for text without any
+    if '<' in text:
+        text = TAG_RE.sub('', text)
     # Split on whitespace and count
-    words = text.split()
-    return len(words)
+    return len(text.split())
 
 def analyze_entry(entry):
     """
@@ -28,7 +31,7 @@ def analyze_entry(entry):
     entry_title = entry.get('T', entry.get('n', 'UNKNOWN'))
 
     # Remove HTML tags from title for readability
-    entry_title_clean = re.sub(r'<[^>]+>', '', entry_title)
+    entry_title_clean = TAG_RE.sub('', entry_title)
 
     impact_data = entry.get('I', {})
 
@@ -68,77 +71,57 @@ def analyze_entry(entry):
 
 def is_date_in_range(date_str):
     """Check if date is October 2025 or later."""
-    try:
-        date = datetime.strptime(date_str, '%Y-%m-%d')
-        cutoff = datetime(2025, 10, 1)
-        return date >= cutoff
-    except:
-        return False
-
-def main():
-    # Read the HTML file
-    with open('/Users/a.princealbert3/Desktop/TRACKER APP/tckc-threat-tracker-v10-Jan30final.html', 'r', encoding='utf-8') as f:
-        content = f.read()
-
-    # Find the database object - look for const DATA = {...}
-    # The database appears to be in a JavaScript variable
-    match = re.search(r'const\s+DATA\s*=\s*({.*?});', content, re.DOTALL)
-
-    if not match:
-        print("Could not find database object in file")
-        return
-
-    db_json = match.group(1)
-
-    try:
-        db = json.loads(db_json)
-    except json.JSONDecodeError as e:
-        print(f"Error parsing JSON: {e}")
-        return
-
-    # Analyze all categories
-    all_flagged = []
-
-    categories = ['executive_actions', 'agency_actions', 'legislation', 'litigation', 'international']
+    # Dates are ISO YYYY-MM-DD, so a string compare orders them like datetimes
+    return isinstance(date_str, str) and len(date_str) == 10 and date_str >= '2025-10-01'
 
+def iter_flagged(db, categories):
+    """Yield the flagged result of each in-range entry, category by category."""
     for category in categories:
         if category not in db:
             continue
 
-        entries = db[category]
-        for entry in entries:
-            date = entry.get('d', '')
-            if is_date_in_range(date):
+        for entry in db[category]:
+            if is_date_in_range(entry.get('d', '')):
                 result = analyze_entry(entry)
                 if result:
                     result['category'] = category
-                    all_flagged.append(result)
+                    yield result
+
+def main():
+    # Load the database object (const DATA = {...}) from the HTML file
+    db = load_data('/Users/a.princealbert3/Desktop/TRACKER APP/tckc-threat-tracker-v10-Jan30final.html')
+
+    # Analyze all categories
+    categories = ['executive_actions', 'agency_actions', 'legislation', 'litigation', 'international']
 
-    # Sort by date
-    all_flagged.sort(key=lambda x: x['date'])
+    # Sort by date. The categories are not stored in date order, so the
+    # flagged results cannot simply be heapq.merge'd as they stream out
+    all_flagged = sorted(iter_flagged(db, categories), key=lambda x: x['date'])
 
-    # Print results
-    print(f"\n{'='*80}")
-    print(f"ENTRIES FROM OCTOBER 2025 ONWARD WITH COMMUNITY SECTIONS < 250 WORDS")
-    print(f"{'='*80}\n")
-    print(f"Total entries flagged: {len(all_flagged)}\n")
+    # Print results, collecting the report lines and writing them in one go
+    out = []
+    out.append(f"\n{'='*80}")
+    out.append(f"ENTRIES FROM OCTOBER 2025 ONWARD WITH COMMUNITY SECTIONS < 250 WORDS")
+    out.append(f"{'='*80}\n")
+    out.append(f"Total entries flagged: {len(all_flagged)}\n")
 
     for idx, entry in enumerate(all_flagged, 1):
-        print(f"{idx}. ID: {entry['id']}")
-        print(f"   Category: {entry['category']}")
-        print(f"   Date: {entry['date']}")
-        print(f"   Title: {entry['title'][:100]}{'...' if len(entry['title']) > 100 else ''}")
-        print(f"   Flagged communities:")
+        out.append(f"{idx}. ID: {entry['id']}")
+        out.append(f"   Category: {entry['category']}")
+        out.append(f"   Date: {entry['date']}")
+        out.append(f"   Title: {entry['title'][:100]}{'...' if len(entry['title']) > 100 else ''}")
+        out.append(f"   Flagged communities:")
 
         for comm in entry['flagged_communities']:
-            print(f"      - {comm['community']}: {comm['total_words']} words total")
-            print(f"        (people: {comm['people']}, places: {comm['places']}, " +
-                  f"practices: {comm['practices']}, treasures: {comm['treasures']})")
-        print()
-
-    print(f"{'='*80}")
-    print(f"ANALYSIS COMPLETE - {len(all_flagged)} entries flagged")
-    print(f"{'='*80}\n")
+            out.append(f"      - {comm['community']}: {comm['total_words']} words total")
+            out.append(f"        (people: {comm['people']}, places: {comm['places']}, " +
+                       f"practices: {comm['practices']}, treasures: {comm['treasures']})")
+        out.append("")
+
+    out.append(f"{'='*80}")
+    out.append(f"ANALYSIS COMPLETE - {len(all_flagged)} entries flagged")
+    out.append(f"{'='*80}\n")
+    sys.stdout.write('\n'.join(out) + '\n')
 
 if __name__ == '__main__':
     main()
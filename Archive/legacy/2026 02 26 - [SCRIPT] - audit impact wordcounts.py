@@ -5,15 +5,30 @@ Finds all entries dated July, August, September 2025 and counts words
 in each community section's people/places/practices/treasures fields.
 """
 
+import contextlib
+import io
 import re
 import json
 import sys
+from pathlib import Path
+
+IMPACT_FIELDS = frozenset({'people', 'places', 'practices', 'treasures'})
+# Dates are ISO YYYY-MM-DD; the audited window is these months
+TARGET_MONTHS = frozenset({'2025-07', '2025-08', '2025-09'})
+
+DATA_START_RE = re.compile(rb'const\s+DATA\s*=\s*\{')
+TAG_RE = re.compile(r'<[^>]+>')
+
+# Scanning for the end of DATA: the next brace or quote outside a string, and
+# the rest of a string (escapes included) up to its closing quote
+BRACE_OR_QUOTE_RE = re.compile(rb'[{}"]')
+STRING_TAIL_RE = re.compile(rb'[^"\\]*(?:\\.[^"\\]*)*"', re.DOTALL)
 
 
 def extract_data_object(html_content):
-    """Extract the DATA JavaScript object from the HTML file."""
+    """Extract the DATA JavaScript object from the raw HTML bytes."""
     # Find the start of the DATA object
-    match = re.search(r'const\s+DATA\s*=\s*\{', html_content)
+    match = DATA_START_RE.search(html_content)
     if not match:
         print("ERROR: Could not find 'const DATA = {' in the file.")
         sys.exit(1)
@@ -21,36 +36,30 @@ def extract_data_object(html_content):
     start_idx = match.start() + len('const DATA = ')
 
     # Now we need to find the matching closing brace
-    # We'll track brace depth
+    # We'll track brace depth, jumping from brace to brace with regex
+    # searches and skipping each string in one match
     depth = 0
-    in_string = False
-    escape_next = False
     end_idx = start_idx
-
-    for i in range(start_idx, len(html_content)):
-        ch = html_content[i]
-
-        if escape_next:
-            escape_next = False
-            continue
-
-        if ch == '\\' and in_string:
-            escape_next = True
-            continue
-
-        if ch == '"' and not escape_next:
-            in_string = not in_string
-            continue
-
-        if in_string:
-            continue
-
-        if ch == '{':
+    pos = start_idx
+
+    while True:
+        match = BRACE_OR_QUOTE_RE.search(html_content, pos)
+        if not match:
+            break
+        ch = match.group()
+        pos = match.end()
+
+        if ch == b'"':
+            match = STRING_TAIL_RE.match(html_content, pos)
+            if not match:
+                break
+            pos = match.end()
+        elif ch == b'{':
             depth += 1
-        elif ch == '}':
+        else:
             depth -= 1
             if depth == 0:
-                end_idx = i + 1
+                end_idx = pos
                 break
 
     json_str = html_content[start_idx:end_idx]
@@ -60,7 +69,7 @@ def extract_data_object(html_content):
     except json.JSONDecodeError as e:
         print(f"ERROR: Failed to parse JSON: {e}")
         # Try to show context around the error
-        line_no = json_str[:e.pos].count('\n') + 1
+        line_no = e.doc[:e.pos].count('\n') + 1
         print(f"  Error at approximately line {line_no} of the JSON object")
         sys.exit(1)
 
@@ -78,8 +87,7 @@ def is_community_object(obj):
     """Check if an object looks like a community impact object (has people/places/practices/treasures)."""
     if not isinstance(obj, dict):
         return False
-    expected_fields = {'people', 'places', 'practices', 'treasures'}
-    return bool(expected_fields & set(obj.keys()))
+    return not IMPACT_FIELDS.isdisjoint(obj)
 
 
 def analyze_entry_impact(impact_obj):
@@ -125,8 +133,7 @@ def analyze_entry_impact(impact_obj):
                 notes.append(f"'{field_name}' is type {type(field_val).__name__}")
 
         # Check for nested community objects (keys that are not standard fields)
-        standard_fields = {'people', 'places', 'practices', 'treasures'}
-        nested_communities = [k for k in community_data.keys() if k not in standard_fields]
+        nested_communities = [k for k in community_data.keys() if k not in IMPACT_FIELDS]
         if nested_communities:
             notes.append(f"NESTED communities skipped: {', '.join(nested_communities)}")
 
@@ -148,9 +155,9 @@ def main():
 
     # Read file
     print("Reading file...")
-    with open(filepath, 'r', encoding='utf-8') as f:
-        html_content = f.read()
-    print(f"  File size: {len(html_content):,} characters")
+    # Kept as bytes: only the DATA slice is ever decoded, by json.loads
+    html_content = Path(filepath).read_bytes()
+    print(f"  File size: {len(html_content):,} bytes")
 
     # Extract DATA
     print("Extracting DATA object...")
@@ -177,9 +184,7 @@ def main():
                 continue
 
             # Check if date is in July, August, or September 2025
-            if (date_str.startswith('2025-07') or
-                date_str.startswith('2025-08') or
-                date_str.startswith('2025-09')):
+            if date_str[:7] in TARGET_MONTHS:
                 target_entries.append((category, entry))
 
     print(f"  Total entries scanned: {total_entries}")
@@ -199,7 +204,7 @@ def main():
         # Get the full title with HTML stripped
         full_title = entry.get('T', title)
         # Strip HTML tags for display
-        clean_title = re.sub(r'<[^>]+>', '', full_title)
+        clean_title = TAG_RE.sub('', full_title)
 
         impact = entry.get('I')
         if not impact or not isinstance(impact, dict):
@@ -218,91 +223,95 @@ def main():
     # Sort by word count ascending (most problematic first)
     all_community_results.sort(key=lambda x: x[5])
 
-    # Print report
-    print("=" * 120)
-    print("DETAILED REPORT: Community Word Counts (Sorted by Word Count - Ascending)")
-    print("=" * 120)
-
-    flagged_count = 0
-    ok_count = 0
+    # Render the report in memory and write it to stdout in one go
+    report = io.StringIO()
+    with contextlib.redirect_stdout(report):
+        # Print report
+        print("=" * 120)
+        print("DETAILED REPORT: Community Word Counts (Sorted by Word Count - Ascending)")
+        print("=" * 120)
 
-    for (entry_id, date_str, clean_title, category, community_name,
-         word_count, field_details, notes) in all_community_results:
+        flagged_count = 0
+        ok_count = 0
 
-        flag = "** UNDER 300 **" if word_count < 300 else "OK"
-        if word_count < 300:
-            flagged_count += 1
-        else:
-            ok_count += 1
+        for (entry_id, date_str, clean_title, category, community_name,
+             word_count, field_details, notes) in all_community_results:
 
-        print()
-        print("-" * 120)
-        print(f"  Entry ID   : {entry_id}")
-        print(f"  Date       : {date_str}")
-        print(f"  Category   : {category}")
-        print(f"  Title      : {clean_title[:100]}{'...' if len(clean_title) > 100 else ''}")
-        print(f"  Community  : {community_name}")
-        print(f"  TOTAL WORDS: {word_count}  [{flag}]")
-        if field_details:
-            print(f"    - people   : {field_details.get('people', 'N/A'):>4} words")
-            print(f"    - places   : {field_details.get('places', 'N/A'):>4} words")
-            print(f"    - practices: {field_details.get('practices', 'N/A'):>4} words")
-            print(f"    - treasures: {field_details.get('treasures', 'N/A'):>4} words")
-        if notes:
-            print(f"  NOTES      : {notes}")
-
-    # Print entries without Impact Analysis
-    if entries_without_impact:
+            flag = "** UNDER 300 **" if word_count < 300 else "OK"
+            if word_count < 300:
+                flagged_count += 1
+            else:
+                ok_count += 1
+
+            print()
+            print("-" * 120)
+            print(f"  Entry ID   : {entry_id}")
+            print(f"  Date       : {date_str}")
+            print(f"  Category   : {category}")
+            print(f"  Title      : {clean_title[:100]}{'...' if len(clean_title) > 100 else ''}")
+            print(f"  Community  : {community_name}")
+            print(f"  TOTAL WORDS: {word_count}  [{flag}]")
+            if field_details:
+                print(f"    - people   : {field_details.get('people', 'N/A'):>4} words")
+                print(f"    - places   : {field_details.get('places', 'N/A'):>4} words")
+                print(f"    - practices: {field_details.get('practices', 'N/A'):>4} words")
+                print(f"    - treasures: {field_details.get('treasures', 'N/A'):>4} words")
+            if notes:
+                print(f"  NOTES      : {notes}")
+
+        # Print entries without Impact Analysis
+        if entries_without_impact:
+            print()
+            print()
+            print("=" * 120)
+            print("ENTRIES IN DATE RANGE WITHOUT IMPACT ANALYSIS (I) FIELD")
+            print("=" * 120)
+            for entry_id, date_str, clean_title, category in sorted(entries_without_impact, key=lambda x: x[1]):
+                print(f"  {entry_id:30s}  {date_str}  [{category:20s}]  {clean_title[:70]}")
+
+        # Summary
         print()
         print()
         print("=" * 120)
-        print("ENTRIES IN DATE RANGE WITHOUT IMPACT ANALYSIS (I) FIELD")
+        print("SUMMARY")
         print("=" * 120)
-        for entry_id, date_str, clean_title, category in sorted(entries_without_impact, key=lambda x: x[1]):
-            print(f"  {entry_id:30s}  {date_str}  [{category:20s}]  {clean_title[:70]}")
-
-    # Summary
-    print()
-    print()
-    print("=" * 120)
-    print("SUMMARY")
-    print("=" * 120)
-    print(f"  Date range: July 2025 - September 2025")
-    print(f"  Total entries in range: {len(target_entries)}")
-    print(f"  Entries WITH Impact Analysis: {len(entries_with_impact)}")
-    print(f"  Entries WITHOUT Impact Analysis: {len(entries_without_impact)}")
-    print(f"  Total community sections audited: {len(all_community_results)}")
-    print(f"  Community sections UNDER 300 words (flagged): {flagged_count}")
-    print(f"  Community sections at/above 300 words (OK): {ok_count}")
-    print()
+        print(f"  Date range: July 2025 - September 2025")
+        print(f"  Total entries in range: {len(target_entries)}")
+        print(f"  Entries WITH Impact Analysis: {len(entries_with_impact)}")
+        print(f"  Entries WITHOUT Impact Analysis: {len(entries_without_impact)}")
+        print(f"  Total community sections audited: {len(all_community_results)}")
+        print(f"  Community sections UNDER 300 words (flagged): {flagged_count}")
+        print(f"  Community sections at/above 300 words (OK): {ok_count}")
+        print()
 
-    # Per-month breakdown
-    print("  PER-MONTH BREAKDOWN:")
-    for month_prefix, month_name in [('2025-07', 'July 2025'), ('2025-08', 'August 2025'), ('2025-09', 'September 2025')]:
-        month_entries = [(c, e) for c, e in target_entries if e.get('d', '').startswith(month_prefix)]
-        print(f"    {month_name}: {len(month_entries)} entries")
+        # Per-month breakdown
+        print("  PER-MONTH BREAKDOWN:")
+        for month_prefix, month_name in [('2025-07', 'July 2025'), ('2025-08', 'August 2025'), ('2025-09', 'September 2025')]:
+            month_entries = [(c, e) for c, e in target_entries if e.get('d', '').startswith(month_prefix)]
+            print(f"    {month_name}: {len(month_entries)} entries")
 
-    # Per-category breakdown
-    print()
-    print("  PER-CATEGORY BREAKDOWN:")
-    for cat in found_categories:
-        cat_entries = [(c, e) for c, e in target_entries if c == cat]
-        if cat_entries:
-            print(f"    {cat}: {len(cat_entries)} entries")
-
-    # Flagged entries summary
-    if flagged_count > 0:
+        # Per-category breakdown
         print()
-        print(f"  FLAGGED COMMUNITY SECTIONS (under 300 words) - {flagged_count} total:")
-        for (entry_id, date_str, clean_title, category, community_name,
-             word_count, field_details, notes) in all_community_results:
-            if word_count < 300:
-                print(f"    {entry_id:30s} | {date_str} | {community_name:25s} | {word_count:4d} words")
+        print("  PER-CATEGORY BREAKDOWN:")
+        for cat in found_categories:
+            cat_entries = [(c, e) for c, e in target_entries if c == cat]
+            if cat_entries:
+                print(f"    {cat}: {len(cat_entries)} entries")
+
+        # Flagged entries summary
+        if flagged_count > 0:
+            print()
+            print(f"  FLAGGED COMMUNITY SECTIONS (under 300 words) - {flagged_count} total:")
+            for (entry_id, date_str, clean_title, category, community_name,
+                 word_count, field_details, notes) in all_community_results:
+                if word_count < 300:
+                    print(f"    {entry_id:30s} | {date_str} | {community_name:25s} | {word_count:4d} words")
 
-    print()
-    print("=" * 120)
-    print("END OF AUDIT REPORT")
-    print("=" * 120)
+        print()
+        print("=" * 120)
+        print("END OF AUDIT REPORT")
+        print("=" * 120)
+    sys.stdout.write(report.getvalue())
 
 
 if __name__ == '__main__':
@@ -0,0 +1,112 @@
+"""
+Shared loader for the DATA object embedded in the TCKC Threat Tracker HTML.
+
+The analyze scripts all parse the same multi-MB 'const DATA = {...};' literal.
+load_data() memoizes the last parse, keyed on the file's mtime, so scripts run
+in one process (or one script asking twice) pay for the read and parse once,
+and an edited file is picked up again. The cached object is shared, so
+callers must not modify it.
+"""
+
+import json
+import mmap
+import os
+import sys
+from functools import lru_cache
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+
+def _parse_json(json_str):
+    """Parse a JSON str or UTF-8 bytes, with orjson when available."""
+    return orjson.loads(json_str) if ORJSON_AVAILABLE else json.loads(json_str)
+
+
+def _find_closing_brace(html_text, start):
+    """
+    Walk forward from the '{' at start, skipping string contents, and return
+    the index just past its matching '}', or None if it never closes.
+    """
+    depth = 0
+    i = start
+    while i < len(html_text):
+        ch = html_text[i]
+        if ch == '{':
+            depth += 1
+        elif ch == '}':
+            depth -= 1
+            if depth == 0:
+                return i + 1
+        elif ch == '"':
+            # Skip string contents to avoid counting braces inside strings
+            i += 1
+            while i < len(html_text):
+                if html_text[i] == '\\':
+                    i += 2  # skip escaped character
+                    continue
+                if html_text[i] == '"':
+                    break
+                i += 1
+        i += 1
+    return None
+
+
+def extract_data_json(html_bytes):
+    """
+    Extract the DATA JSON object from the raw (bytes or mmap) HTML file.
+    Only the DATA slice is ever decoded.
+    """
+    # Find 'const DATA = {' and extract everything until the closing '};'
+    marker = b'const DATA = '
+    start = html_bytes.find(marker + b'{')
+    if start == -1:
+        print("ERROR: Could not find 'const DATA = {' in the file.")
+        sys.exit(1)
+    start += len(marker)
+
+    # The generated file ends the literal with '};' and a newline. JSON
+    # strings cannot hold a raw newline, so the first '};\n' closes DATA.
+    # Only if that slice fails to parse do we walk the braces by hand.
+    end = html_bytes.find(b'};\n', start) + 1
+    if end:
+        try:
+            return _parse_json(html_bytes[start:end])
+        except ValueError:
+            pass
+
+    html_text = html_bytes[start:].decode('utf-8')
+    end = _find_closing_brace(html_text, 0)
+    if end is None:
+        print("ERROR: Could not find matching closing brace for DATA object.")
+        sys.exit(1)
+
+    json_str = html_text[:end]
+
+    # The JSON may contain HTML in strings (like <span> tags), which is fine for json.loads
+    try:
+        data = _parse_json(json_str)
+    except json.JSONDecodeError as e:
+        print(f"ERROR: Failed to parse DATA JSON: {e}")
+        # Try to show context around error
+        pos = e.pos if hasattr(e, 'pos') else 0
+        print(f"Context: ...{json_str[max(0,pos-100):pos+100]}...")
+        sys.exit(1)
+
+    return data
+
+
+@lru_cache(maxsize=1)
+def _load_data(path, mtime_ns):
+    """Parse the DATA object of the HTML file at path (mtime_ns keys the cache)."""
+    with open(path, 'rb') as f:
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as html_bytes:
+            return extract_data_json(html_bytes)
+
+
+def load_data(path):
+    """Return the parsed DATA object of the HTML file at path, reparsing only if it changed."""
+    return _load_data(path, os.stat(path).st_mtime_ns)
@@ -0,0 +1,53 @@
+"""
+================================================================================
+JSON EXPORT
+================================================================================
+Streaming JSON writer shared by the extractor and query exports, so both
+write files in the same layout.
+================================================================================
+"""
+
+import json
+import sqlite3
+from typing import Any, Iterator
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+
+def _json_bytes(value: Any) -> bytes:
+    """Encode one JSON value indented by two spaces, with orjson when available."""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(value, default=str, option=orjson.OPT_INDENT_2)
+    return json.dumps(value, indent=2, default=str).encode()
+
+
+def write_json(f, value: Any, level: int = 0):
+    """
+    Write ``value`` to binary file ``f`` as JSON laid out like
+    ``json.dump(indent=2)``, consuming iterators as arrays one item at a time
+    so row sets never have to be held in memory together.
+    """
+    if isinstance(value, sqlite3.Row):
+        value = dict(value)
+    pad = b'\n' + b'  ' * (level + 1)
+    close = b'\n' + b'  ' * level
+    if isinstance(value, dict):
+        f.write(b'{')
+        for i, (key, item) in enumerate(value.items()):
+            f.write((b',' if i else b'') + pad + _json_bytes(key) + b': ')
+            write_json(f, item, level + 1)
+        f.write(close + b'}' if value else b'}')
+    elif isinstance(value, Iterator):
+        f.write(b'[')
+        wrote = False
+        for item in value:
+            f.write((b',' if wrote else b'') + pad)
+            write_json(f, item, level + 1)
+            wrote = True
+        f.write(close + b']' if wrote else b']')
+    else:
+        f.write(_json_bytes(value).replace(b'\n', close))
@@ -22,17 +22,30 @@ Author: Generated for TCKC Threat Tracker Integration
 """
 
 import os
+import re
 import json
 import sqlite3
 import logging
 import time
+import threading
 import csv
+import functools
 from datetime import datetime, timedelta
-from typing import Dict, List, Any, Optional, Tuple
+from typing import Dict, Iterable, Iterator, List, Any, Optional, Tuple
 from dataclasses import dataclass, field, asdict
 from pathlib import Path
+import io
 from io import StringIO
 from abc import ABC, abstractmethod
+from concurrent.futures import ThreadPoolExecutor
+from itertools import chain, count
+
+# requests is required by every extractor, so it is not optional
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+from json_export import write_json
 
 # Configure logging
 logging.basicConfig(
@@ -46,22 +59,48 @@ logging.basicConfig(
 logger = logging.getLogger('IntlExtractor')
 
 # =============================================================================
-# TRY IMPORTS - Handle missing dependencies gracefully
+# TRY IMPORTS - Handle missing optional dependencies gracefully
 # =============================================================================
 try:
-    import requests
-    REQUESTS_AVAILABLE = True
-except ImportError:
-    REQUESTS_AVAILABLE = False
-    logger.warning("requests library not available - install with: pip install requests")
-
-try:
-    from bs4 import BeautifulSoup
+    from bs4 import BeautifulSoup, SoupStrainer
     BS4_AVAILABLE = True
 except ImportError:
     BS4_AVAILABLE = False
     logger.warning("beautifulsoup4 not available - install with: pip install beautifulsoup4")
 
+try:
+    from lxml import html as lxml_html
+    LXML_AVAILABLE = True
+    HTML_PARSER = 'lxml'
+except ImportError:
+    LXML_AVAILABLE = False
+    HTML_PARSER = 'html.parser'
+
+try:
+    import ijson
+    IJSON_AVAILABLE = True
+except ImportError:
+    IJSON_AVAILABLE = False
+
+try:
+    import pyarrow as pa
+    import pyarrow.csv as pa_csv
+    PYARROW_AVAILABLE = True
+except ImportError:
+    PYARROW_AVAILABLE = False
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+try:
+    import ahocorasick
+    AHOCORASICK_AVAILABLE = True
+except ImportError:
+    AHOCORASICK_AVAILABLE = False
+
 # =============================================================================
 # CONFIGURATION
 # =============================================================================
@@ -83,6 +122,12 @@ class ExtractorConfig:
     icj_rate_limit: float = 0.3
     nato_rate_limit: float = 0.3
     
+    # Worker threads for extractors that fan out over many API calls
+    max_workers: int = 8
+    
+    # Sources extracted concurrently by MasterExtractor.extract_all
+    source_workers: int = 6
+    
     # Time range for data collection
     start_year: int = 2020
     end_year: int = 2025
@@ -142,23 +187,89 @@ class APIEndpoints:
 # =============================================================================
 # DATABASE MANAGER
 # =============================================================================
+@functools.lru_cache(maxsize=64)
+def _build_insert_sql(table: str, columns: Tuple[str, ...]) -> str:
+    """Build the INSERT statement for a table/column layout once, so the
+    identical string keeps hitting sqlite3's prepared-statement cache."""
+    placeholders = ','.join('?' for _ in columns)
+    return f"INSERT OR REPLACE INTO {table} ({','.join(columns)}) VALUES ({placeholders})"
+
 class DatabaseManager:
     """Manages SQLite database for storing extracted data."""
     
+    # Applied on every connection: WAL journaling with relaxed fsync so bulk
+    # inserts are not paying a full sync per commit.
+    PRAGMAS = (
+        "PRAGMA journal_mode=WAL;"
+        "PRAGMA synchronous=NORMAL;"
+        "PRAGMA temp_store=MEMORY;"
+        "PRAGMA cache_size=-65536;"
+        "PRAGMA mmap_size=268435456;"
+        # INSERT OR REPLACE must fire the delete triggers that keep the
+        # full-text indexes in sync
+        "PRAGMA recursive_triggers=ON;"
+    )
+    
+    # Text columns indexed with FTS5 for keyword search, per table
+    FTS_COLUMNS = {
+        'wto_disputes': ('title', 'subject_matter', 'complainant', 'respondent'),
+        'icj_cases': ('case_name', 'subject_matter', 'applicant', 'respondent'),
+        'unsc_resolutions': ('title', 'topics', 'summary'),
+        'nato_documents': ('title', 'summary'),
+    }
+    
     def __init__(self, db_path: str):
         self.db_path = db_path
         Path(db_path).parent.mkdir(parents=True, exist_ok=True)
+        # One connection for the life of the manager; the lock serializes
+        # access since a sqlite3 connection is not safe to share unguarded.
+        self._lock = threading.RLock()
+        self._conn = self._connect()
+        # Runs in progress live here and are written to extraction_log once,
+        # on completion, instead of as an INSERT followed by an UPDATE.
+        self._running: Dict[int, Tuple[str, str, str]] = {}
+        self._run_ids = count(1)
         self._init_schema()
     
-    def _get_conn(self):
-        conn = sqlite3.connect(self.db_path)
+    def _connect(self) -> sqlite3.Connection:
+        # Autocommit mode - multi-statement writes open their own transaction
+        conn = sqlite3.connect(self.db_path, isolation_level=None,
+                               check_same_thread=False, cached_statements=256)
         conn.row_factory = sqlite3.Row
+        conn.executescript(self.PRAGMAS)
         return conn
     
+    def close(self):
+        """Close the underlying connection."""
+        with self._lock:
+            self._conn.close()
+    
     def _init_schema(self):
         """Initialize database schema."""
-        conn = self._get_conn()
-        cursor = conn.cursor()
+        with self._lock:
+            self._create_schema(self._conn.cursor())
+            self._insert_columns = self._load_insert_columns()
+        logger.info(f"Database initialized at {self.db_path}")
+    
+    def data_columns(self, table: str) -> Tuple[str, ...]:
+        """Columns holding extracted data, i.e. all but id and extracted_at."""
+        return self._insert_columns[table]
+    
+    def _load_insert_columns(self) -> Dict[str, Tuple[str, ...]]:
+        """Map each table to the columns insert_many fills, in schema order."""
+        generated = {'id', 'extracted_at'}
+        tables = [row[0] for row in self._conn.execute(
+            "SELECT name FROM sqlite_master WHERE type = 'table' AND name NOT LIKE 'sqlite_%'"
+        )]
+        return {
+            table: tuple(col[1] for col in self._conn.execute(f"PRAGMA table_info({table})")
+                         if col[1] not in generated)
+            for table in tables
+        }
+    
+    def _create_schema(self, cursor: sqlite3.Cursor):
+        """Create tables and indexes in a single transaction."""
+        cursor.execute("BEGIN")
         
         # WTO Trade Data
         cursor.execute("""
@@ -317,133 +428,388 @@ class DatabaseManager:
             )
         """)
         
+        # Download cache - skips re-fetching corpora that have not changed
+        cursor.execute("""
+            CREATE TABLE IF NOT EXISTS source_cache (
+                url TEXT PRIMARY KEY,
+                checksum TEXT,
+                etag TEXT,
+                updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+            ) WITHOUT ROWID
+        """)
+        
+        # WTO dispute parties - one row per (party, role), keyed for party lookups
+        parties_existed = cursor.execute(
+            "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'wto_dispute_parties'"
+        ).fetchone() is not None
+        cursor.execute("""
+            CREATE TABLE IF NOT EXISTS wto_dispute_parties (
+                party TEXT NOT NULL,
+                role TEXT NOT NULL,
+                dispute_number TEXT NOT NULL,
+                PRIMARY KEY (party, role, dispute_number)
+            ) WITHOUT ROWID
+        """)
+        # Backfill disputes extracted before the parties table existed, split
+        # into parties exactly as WTOExtractor does for new extractions
+        if not parties_existed:
+            disputes = cursor.execute(
+                "SELECT complainant, respondent, dispute_number FROM wto_disputes"
+                " WHERE dispute_number IS NOT NULL"
+            ).fetchall()
+            cursor.executemany(
+                "INSERT OR IGNORE INTO wto_dispute_parties (party, role, dispute_number) VALUES (?, ?, ?)",
+                (party for row in disputes for party in WTOExtractor._dispute_parties(dict(row)))
+            )
+        
         # Create indexes
         cursor.execute("CREATE INDEX IF NOT EXISTS idx_wto_year ON wto_trade_data(year)")
-        cursor.execute("CREATE INDEX IF NOT EXISTS idx_imf_country ON imf_economic_data(country_code)")
+        # (country_code, year) serves both the country filter and ORDER BY year
+        cursor.execute("DROP INDEX IF EXISTS idx_imf_country")
+        cursor.execute("CREATE INDEX IF NOT EXISTS idx_imf_country_year ON imf_economic_data(country_code, year)")
+        # Per-indicator lookups; World Bank's UNIQUE key already covers these
+        cursor.execute("CREATE INDEX IF NOT EXISTS idx_imf_country_indicator_year ON imf_economic_data(country_code, indicator_code, year)")
         cursor.execute("CREATE INDEX IF NOT EXISTS idx_unsc_date ON unsc_resolutions(date_adopted)")
+        cursor.execute("CREATE INDEX IF NOT EXISTS idx_nato_date ON nato_documents(date_published)")
+        # Expression index matching the ORDER BY in recent ICJ developments
+        cursor.execute("CREATE INDEX IF NOT EXISTS idx_icj_effective_date ON icj_cases(COALESCE(date_decided, date_filed))")
         cursor.execute("CREATE INDEX IF NOT EXISTS idx_icj_us ON icj_cases(us_involvement)")
+        cursor.execute("CREATE INDEX IF NOT EXISTS idx_wto_disputes_cult ON wto_disputes(cultural_relevance)")
+        cursor.execute("CREATE INDEX IF NOT EXISTS idx_unsc_cult ON unsc_resolutions(cultural_relevance)")
+        cursor.execute("CREATE INDEX IF NOT EXISTS idx_icj_cult ON icj_cases(cultural_relevance)")
+        cursor.execute("CREATE INDEX IF NOT EXISTS idx_wb_country_year ON world_bank_indicators(country_code, year)")
+        # US-relevance filters used by get_us_relevant_data and the export
+        cursor.execute("CREATE INDEX IF NOT EXISTS idx_wto_complainant ON wto_disputes(complainant)")
+        cursor.execute("CREATE INDEX IF NOT EXISTS idx_wto_respondent ON wto_disputes(respondent)")
+        cursor.execute("CREATE INDEX IF NOT EXISTS idx_unsc_us ON unsc_resolutions(us_relevance) WHERE us_relevance IS NOT NULL")
         
-        conn.commit()
-        conn.close()
-        logger.info(f"Database initialized at {self.db_path}")
-    
-    def insert_many(self, table: str, records: List[Dict]) -> int:
-        """Insert multiple records, ignoring duplicates."""
-        if not records:
-            return 0
-        
-        conn = self._get_conn()
-        cursor = conn.cursor()
-        
-        columns = list(records[0].keys())
-        placeholders = ','.join(['?' for _ in columns])
-        column_str = ','.join(columns)
+        self._create_fts(cursor)
         
-        inserted = 0
-        for record in records:
+        cursor.execute("COMMIT")
+    
+    def optimize(self):
+        """
+        Refresh the planner statistics after a load. A database without any
+        runs a full ANALYZE once; afterwards PRAGMA optimize re-analyzes only
+        tables whose contents changed enough to matter.
+        """
+        with self._lock:
+            analyzed = self._conn.execute(
+                "SELECT 1 FROM sqlite_master WHERE name = 'sqlite_stat1'"
+            ).fetchone()
+            self._conn.execute("PRAGMA analysis_limit=1000")
+            self._conn.execute("PRAGMA optimize" if analyzed else "ANALYZE")
+    
+    def _create_fts(self, cursor: sqlite3.Cursor):
+        """Create external-content FTS5 indexes, with triggers mirroring writes."""
+        existing = {row[0] for row in cursor.execute(
+            "SELECT name FROM sqlite_master WHERE type = 'table'"
+        )}
+        for table, columns in self.FTS_COLUMNS.items():
+            fts = f"{table}_fts"
+            if fts in existing:
+                continue
+            cols = ', '.join(columns)
+            new_cols = ', '.join(f"new.{col}" for col in columns)
+            old_cols = ', '.join(f"old.{col}" for col in columns)
             try:
                 cursor.execute(
-                    f"INSERT OR REPLACE INTO {table} ({column_str}) VALUES ({placeholders})",
-                    [record.get(col) for col in columns]
+                    f"CREATE VIRTUAL TABLE {fts} USING fts5({cols}, content='{table}', content_rowid='id')"
                 )
-                inserted += 1
-            except Exception as e:
-                logger.warning(f"Insert failed: {e}")
+            except sqlite3.OperationalError as e:
+                logger.warning(f"Full-text search unavailable ({e}); keyword search will use LIKE")
+                return
+            cursor.execute(f"""
+                CREATE TRIGGER IF NOT EXISTS {fts}_ai AFTER INSERT ON {table} BEGIN
+                    INSERT INTO {fts}(rowid, {cols}) VALUES (new.id, {new_cols});
+                END
+            """)
+            cursor.execute(f"""
+                CREATE TRIGGER IF NOT EXISTS {fts}_ad AFTER DELETE ON {table} BEGIN
+                    INSERT INTO {fts}({fts}, rowid, {cols}) VALUES ('delete', old.id, {old_cols});
+                END
+            """)
+            cursor.execute(f"""
+                CREATE TRIGGER IF NOT EXISTS {fts}_au AFTER UPDATE ON {table} BEGIN
+                    INSERT INTO {fts}({fts}, rowid, {cols}) VALUES ('delete', old.id, {old_cols});
+                    INSERT INTO {fts}(rowid, {cols}) VALUES (new.id, {new_cols});
+                END
+            """)
+            # Index rows extracted before the FTS table existed
+            cursor.execute(f"INSERT INTO {fts}({fts}) VALUES ('rebuild')")
+    
+    def insert_many(self, table: str, records: Iterable[Any]) -> int:
+        """
+        Insert multiple records, ignoring duplicates.
+        
+        ``records`` may be a list or any iterable of dicts; rows are built in
+        the table's schema column order, with absent keys stored as NULL, and
+        generated lazily as executemany consumes them. Records may instead be
+        tuples already in that column order, which are passed through as-is.
+        Recovery after a failed batch needs a list or tuple to replay.
+        """
+        records_iter = iter(records)
+        first = next(records_iter, None)
+        if first is None:
+            return 0
         
+        as_tuples = isinstance(first, tuple)
+        if as_tuples:
+            columns = self._insert_columns[table][:len(first)]
+        else:
+            columns = self._insert_columns.get(table) or tuple(first.keys())
+            unknown = first.keys() - set(columns)
+            if unknown:
+                logger.warning(f"Ignoring fields not in {table}: {', '.join(sorted(unknown))}")
+        sql = _build_insert_sql(table, columns)
+        
+        replayable = isinstance(records, (list, tuple))
+        
+        def make_rows():
+            source = records if replayable else chain([first], records_iter)
+            if as_tuples:
+                return iter(source)
+            return (tuple(record.get(col) for col in columns) for record in source)
+        
+        with self._lock:
+            try:
+                return self._execute_batch(sql, make_rows())
+            except sqlite3.IntegrityError as e:
+                if not replayable:
+                    raise
+                # A constraint other than the REPLACE-able key rejected a row;
+                # fall back to row-by-row so the good rows still land.
+                logger.warning(f"Batch insert into {table} failed ({e}) - retrying row by row")
+                return self._execute_rows(sql, make_rows())
+            except sqlite3.OperationalError as e:
+                if not replayable:
+                    raise
+                logger.warning(f"Batch insert into {table} failed ({e}) - reconnecting")
+                self._conn.close()
+                self._conn = self._connect()
+                return self._execute_batch(sql, make_rows())
+    
+    def delete_many(self, table: str, column: str, values: Iterable[Any]) -> int:
+        """Delete the rows of ``table`` whose ``column`` matches any of ``values``."""
+        with self._lock:
+            return self._execute_batch(f"DELETE FROM {table} WHERE {column} = ?",
+                                       ((value,) for value in values))
+    
+    def _execute_batch(self, sql: str, rows: Iterable[tuple]) -> int:
+        """Run one executemany in a single transaction; return rows written."""
+        conn = self._conn
+        conn.execute("BEGIN")
+        try:
+            cursor = conn.executemany(sql, rows)
+        except Exception:
+            conn.rollback()
+            raise
+        conn.commit()
+        return cursor.rowcount
+    
+    def _execute_rows(self, sql: str, rows: Iterable[tuple]) -> int:
+        """Insert rows one at a time, logging and skipping rejected rows."""
+        conn = self._conn
+        inserted = 0
+        conn.execute("BEGIN")
+        try:
+            for row in rows:
+                try:
+                    conn.execute(sql, row)
+                    inserted += 1
+                except sqlite3.IntegrityError as e:
+                    logger.warning(f"Insert failed: {e} | row: {row}")
+        except Exception:
+            conn.rollback()
+            raise
         conn.commit()
-        conn.close()
         return inserted
     
     def query(self, sql: str, params: tuple = None) -> List[Dict]:
         """Execute a query and return results."""
-        conn = self._get_conn()
-        cursor = conn.cursor()
-        cursor.execute(sql, params or ())
-        columns = [d[0] for d in cursor.description]
-        results = [dict(zip(columns, row)) for row in cursor.fetchall()]
-        conn.close()
-        return results
+        with self._lock:
+            cursor = self._conn.execute(sql, params or ())
+            columns = [d[0] for d in cursor.description]
+            return [dict(zip(columns, row)) for row in cursor.fetchall()]
+    
+    def query_iter(self, sql: str, params: tuple = None,
+                   batch_size: int = 1000) -> Iterator[Dict]:
+        """Execute a query and yield result rows, fetching them in batches."""
+        with self._lock:
+            cursor = self._conn.execute(sql, params or ())
+            columns = [d[0] for d in cursor.description]
+        while True:
+            # Only hold the lock per batch so a slow consumer never blocks writers
+            with self._lock:
+                rows = cursor.fetchmany(batch_size)
+            if not rows:
+                break
+            for row in rows:
+                yield dict(zip(columns, row))
     
     def log_extraction(self, source: str, extraction_type: str) -> int:
         """Log start of extraction, return log ID."""
-        conn = self._get_conn()
-        cursor = conn.cursor()
-        cursor.execute(
-            "INSERT INTO extraction_log (source, extraction_type, started_at, status) VALUES (?, ?, ?, ?)",
-            (source, extraction_type, datetime.now().isoformat(), 'running')
-        )
-        log_id = cursor.lastrowid
-        conn.commit()
-        conn.close()
-        return log_id
+        with self._lock:
+            log_id = next(self._run_ids)
+            self._running[log_id] = (source, extraction_type, datetime.now().isoformat())
+            return log_id
     
     def complete_extraction(self, log_id: int, records: int, status: str = 'success', error: str = None):
         """Log completion of extraction."""
-        conn = self._get_conn()
-        cursor = conn.cursor()
-        cursor.execute(
-            """UPDATE extraction_log 
-               SET completed_at = ?, records_extracted = ?, status = ?, error_message = ?
-               WHERE id = ?""",
-            (datetime.now().isoformat(), records, status, error, log_id)
-        )
-        conn.commit()
-        conn.close()
+        with self._lock:
+            run = self._running.pop(log_id, None)
+            if run is None:
+                logger.warning(f"complete_extraction called for unknown run {log_id}")
+                return
+            self._conn.execute(
+                """INSERT INTO extraction_log 
+                   (source, extraction_type, started_at, completed_at,
+                    records_extracted, status, error_message)
+                   VALUES (?, ?, ?, ?, ?, ?, ?)""",
+                (*run, datetime.now().isoformat(), records, status, error)
+            )
+    
+    def get_source_cache(self, url: str) -> Optional[Dict]:
+        """Return the cached checksum/ETag for a downloaded URL, if any."""
+        rows = self.query("SELECT checksum, etag FROM source_cache WHERE url = ?", (url,))
+        return rows[0] if rows else None
+    
+    def set_source_cache(self, url: str, checksum: Optional[str], etag: Optional[str]):
+        """Remember the checksum/ETag of a fully processed download."""
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO source_cache (url, checksum, etag, updated_at) VALUES (?, ?, ?, ?)",
+                (url, checksum, etag, datetime.now().isoformat())
+            )
 
 # =============================================================================
 # HTTP CLIENT WITH RATE LIMITING
 # =============================================================================
 class RateLimitedClient:
-    """HTTP client with built-in rate limiting."""
+    """HTTP client with built-in rate limiting.
     
-    def __init__(self, rate_limit: float = 1.0):
+    Rate limiting is per client (one per extractor), but every client shares
+    one pooled session so keep-alive connections and TLS sessions are reused
+    across extractors hitting the same hosts.
+    """
+    
+    POOL_SIZE = 32
+    
+    _shared_session = None
+    _session_lock = threading.Lock()
+    
+    def __init__(self, rate_limit: float = 1.0, burst: int = 1):
         self.rate_limit = rate_limit
-        self.last_request = 0
-        self.session = requests.Session() if REQUESTS_AVAILABLE else None
-        
-        if self.session:
-            self.session.headers.update({
-                'User-Agent': 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
-                'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,application/json,*/*;q=0.8',
-                'Accept-Language': 'en-US,en;q=0.9',
-            })
+        self.burst = max(1, burst)
+        # Token bucket state, refilled lazily from time.monotonic()
+        self._tokens = float(self.burst)
+        self._refilled_at = time.monotonic()
+        self._paused_until = 0.0
+        self._lock = threading.Lock()
+        self.session = self._get_session()
+    
+    @classmethod
+    def _get_session(cls) -> 'requests.Session':
+        """Create the shared session on first use."""
+        with cls._session_lock:
+            if cls._shared_session is None:
+                session = requests.Session()
+                # Transport errors and 5xx are retried by urllib3 with backoff;
+                # 429 is handled in get() so the pause applies to every thread.
+                retry = Retry(
+                    total=3,
+                    backoff_factor=1,
+                    status_forcelist=[500, 502, 503, 504],
+                    respect_retry_after_header=True,
+                )
+                adapter = HTTPAdapter(
+                    pool_connections=cls.POOL_SIZE,
+                    pool_maxsize=cls.POOL_SIZE,
+                    max_retries=retry,
+                )
+                session.mount('https://', adapter)
+                session.mount('http://', adapter)
+                session.headers.update({
+                    'User-Agent': 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
+                    'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,application/json,*/*;q=0.8',
+                    'Accept-Language': 'en-US,en;q=0.9',
+                    'Accept-Encoding': 'gzip, deflate',
+                    'Connection': 'keep-alive',
+                })
+                cls._shared_session = session
+            return cls._shared_session
     
     def _wait(self):
-        """Wait if necessary to respect rate limits."""
-        if self.rate_limit > 0:
-            elapsed = time.time() - self.last_request
-            if elapsed < self.rate_limit:
-                time.sleep(self.rate_limit - elapsed)
-        self.last_request = time.time()
+        """Wait if necessary to respect rate limits.
+        
+        Token bucket: one token per ``rate_limit`` seconds, up to ``burst``.
+        A caller takes a token under the lock (driving the count negative
+        reserves a future token) and sleeps outside it, so concurrent threads
+        are spaced correctly without blocking one another.
+        """
+        with self._lock:
+            now = time.monotonic()
+            start = max(now, self._paused_until)
+            if self.rate_limit > 0:
+                elapsed = max(0.0, start - self._refilled_at)
+                self._tokens = min(self.burst, self._tokens + elapsed / self.rate_limit)
+                self._refilled_at = start
+                self._tokens -= 1
+                if self._tokens < 0:
+                    start += -self._tokens * self.rate_limit
+        if start > now:
+            time.sleep(start - now)
+    
+    def _defer(self, seconds: float):
+        """Pause the client so every thread waits, not just the caller."""
+        with self._lock:
+            self._paused_until = max(self._paused_until, time.monotonic() + seconds)
+    
+    @staticmethod
+    def _header_seconds(response, name: str, default: float) -> float:
+        """Read a header holding a delay in seconds, falling back to default."""
+        try:
+            return max(0.0, float(response.headers[name]))
+        except (KeyError, TypeError, ValueError):
+            return default
     
     def get(self, url: str, params: Dict = None, headers: Dict = None, 
-            timeout: int = 30, retries: int = 3) -> Optional[requests.Response]:
-        """Make a GET request with rate limiting and retries."""
-        if not self.session:
-            logger.error("requests library not available")
-            return None
-        
-        self._wait()
+            timeout: int = 30, retries: int = 3,
+            stream: bool = False) -> Optional[requests.Response]:
+        """Make a GET request with rate limiting.
         
+        Transport-level retries happen inside the session adapter; ``retries``
+        bounds how many times a 429 response is waited out and retried.
+        """
         for attempt in range(retries):
+            self._wait()
             try:
                 response = self.session.get(
-                    url, params=params, headers=headers, timeout=timeout
+                    url, params=params, headers=headers, timeout=timeout, stream=stream
                 )
-                
-                if response.status_code == 429:  # Rate limited
-                    wait = int(response.headers.get('Retry-After', 60))
-                    logger.warning(f"Rate limited, waiting {wait}s")
-                    time.sleep(wait)
-                    continue
-                
+            except Exception as e:
+                logger.warning(f"Request failed: {e}")
+                return None
+            
+            if response.status_code == 429:  # Rate limited
+                wait = self._header_seconds(response, 'Retry-After', 60)
+                logger.warning(f"Rate limited (attempt {attempt + 1}), waiting {wait}s")
+                self._defer(wait)
+                continue
+            
+            # Quota exhausted - hold everyone until the server says it resets
+            if response.headers.get('X-RateLimit-Remaining') == '0':
+                self._defer(self._header_seconds(
+                    response, 'Retry-After',
+                    self._header_seconds(response, 'X-RateLimit-Reset', self.rate_limit)
+                ))
+            
+            try:
                 response.raise_for_status()
-                return response
-                
             except Exception as e:
-                logger.warning(f"Request failed (attempt {attempt + 1}): {e}")
-                if attempt < retries - 1:
-                    time.sleep(2 ** attempt)
+                logger.warning(f"Request failed: {e}")
+                return None
+            return response
         
         return None
     
@@ -452,14 +818,75 @@ class RateLimitedClient:
         response = self.get(url, params=params, headers=headers)
         if response:
             try:
+                if ORJSON_AVAILABLE:
+                    return orjson.loads(response.content)
                 return response.json()
-            except:
+            except ValueError:  # orjson and json decode errors both subclass it
                 pass
         return None
+    
+    def iter_json_objects(self, url: str, prefix: str, params: Dict = None,
+                          headers: Dict = None):
+        """
+        Yield each JSON object found at a dotted ``prefix``, or inside an array there.
+        
+        With ijson installed the body is parsed incrementally off the socket,
+        so only one object is held in memory at a time; otherwise the whole
+        document is loaded and walked.
+        """
+        if not IJSON_AVAILABLE:
+            node = self.get_json(url, params=params, headers=headers)
+            for key in prefix.split('.'):
+                node = node.get(key) if isinstance(node, dict) else None
+            for obj in node if isinstance(node, list) else [node]:
+                if isinstance(obj, dict):
+                    yield obj
+            return
+        
+        response = self.get(url, params=params, headers=headers, stream=True)
+        if not response:
+            return
+        
+        targets = (prefix, f'{prefix}.item')
+        builder = None
+        depth = 0
+        try:
+            response.raw.decode_content = True  # undo gzip transfer encoding
+            for path, event, value in ijson.parse(response.raw):
+                if builder is None:
+                    if event == 'start_map' and path in targets:
+                        builder = ijson.ObjectBuilder()
+                        builder.event(event, value)
+                        depth = 1
+                    continue
+                builder.event(event, value)
+                if event in ('start_map', 'start_array'):
+                    depth += 1
+                elif event in ('end_map', 'end_array'):
+                    depth -= 1
+                    if depth == 0:
+                        yield builder.value
+                        builder = None
+        finally:
+            response.close()
 
 # =============================================================================
 # BASE EXTRACTOR CLASS
 # =============================================================================
+# Streamed CSV downloads: bytes read per chunk, and rows held per insert
+CSV_BUFFER_SIZE = 65536
+CSV_BATCH_SIZE = 5000
+
+@functools.lru_cache(maxsize=8)
+def _build_automaton(keywords_lower: Tuple[Tuple[str, str], ...]):
+    """Compile (lowercased, original) keyword pairs into one Aho-Corasick
+    automaton, shared by every extractor configured with the same keywords."""
+    automaton = ahocorasick.Automaton()
+    for kw_lower, kw in keywords_lower:
+        automaton.add_word(kw_lower, kw)
+    automaton.make_automaton()
+    return automaton
+
 class BaseExtractor(ABC):
     """Base class for all data extractors."""
     
@@ -467,6 +894,11 @@ class BaseExtractor(ABC):
         self.config = config
         self.db = db
         self.client = RateLimitedClient(self.rate_limit)
+        # (lowercased, original) pairs so matching never re-lowercases keywords
+        self._keywords_lower = tuple(
+            (kw.lower(), kw) for kw in config.cultural_keywords
+        )
+        self._automaton = _build_automaton(self._keywords_lower) if AHOCORASICK_AVAILABLE else None
     
     @property
     @abstractmethod
@@ -485,18 +917,111 @@ class BaseExtractor(ABC):
         """Main extraction method."""
         pass
     
-    def is_culturally_relevant(self, text: str) -> Tuple[bool, List[str]]:
-        """Check if text contains culturally relevant keywords."""
-        if not text:
+    def is_culturally_relevant(self, *texts: str) -> Tuple[bool, List[str]]:
+        """
+        Check if any of the given texts contains culturally relevant keywords.
+        
+        Each text is lower-cased and scanned on its own, so callers pass
+        fields separately rather than concatenating them first.
+        """
+        parts = [text.lower() for text in texts if text]
+        if not parts:
             return False, []
         
-        text_lower = text.lower()
-        matches = [kw for kw in self.config.cultural_keywords if kw.lower() in text_lower]
+        if self._automaton is not None:
+            # Single pass over each text; report hits in configured keyword order
+            found = {kw for part in parts for _, kw in self._automaton.iter(part)}
+            matches = [kw for _, kw in self._keywords_lower if kw in found]
+        else:
+            matches = [kw for kw_lower, kw in self._keywords_lower
+                       if any(kw_lower in part for part in parts)]
         return len(matches) > 0, matches
+    
+    def _read_csv_rows(self, response: 'requests.Response',
+                       columns: Iterable[str] = None) -> Iterable[Dict[str, str]]:
+        """
+        Stream a CSV response body as row dicts of strings, like csv.DictReader.
+        
+        The body is read off the socket in CSV_BUFFER_SIZE chunks rather than
+        held in memory. With pyarrow installed each block is parsed in C;
+        every column is read as a string so values match the csv module, and
+        when ``columns`` is given only those present in the file are
+        converted, skipping large unused text columns entirely.
+        
+        A body that cannot be parsed, or that ends before its Content-Length,
+        raises instead of ending the rows early, so exhausting the iterator
+        means the whole corpus was read.
+        """
+        try:
+            response.raw.decode_content = True  # undo gzip transfer encoding
+            stream = io.BufferedReader(response.raw, buffer_size=CSV_BUFFER_SIZE)
+            
+            # Take the header line whole off the stream, so the columns chosen
+            # below never come from a truncated peek at the first block
+            head = stream.readline() if PYARROW_AVAILABLE else b''
+            if head.endswith(b'\n'):
+                header = next(csv.reader([head.decode('utf-8', errors='ignore')]), [])
+                header = [name.lstrip('\ufeff') for name in header]
+                wanted = set(columns) if columns is not None else None
+                convert = pa_csv.ConvertOptions(
+                    column_types={name: pa.string() for name in header},
+                    strings_can_be_null=False,
+                    include_columns=[name for name in header if name in wanted] if wanted else None,
+                )
+                # The header is already consumed, so name the columns outright
+                read = pa_csv.ReadOptions(column_names=header, block_size=1 << 20)
+                # Quoted values may span lines, as the csv module allows
+                parse = pa_csv.ParseOptions(newlines_in_values=True)
+                try:
+                    for batch in pa_csv.open_csv(stream, read_options=read, parse_options=parse,
+                                                 convert_options=convert):
+                        yield from batch.to_pylist()
+                except pa.ArrowInvalid as e:
+                    # Rows already yielded cannot be re-read from the socket, so
+                    # fail the import rather than pass off a partial corpus
+                    logger.error(f"pyarrow could not parse CSV: {e}")
+                    raise
+            else:
+                # No pyarrow, or a body that ends inside its header line
+                text = io.TextIOWrapper(stream, encoding='utf-8-sig', errors='ignore', newline='')
+                lines = chain([head.decode('utf-8-sig', errors='ignore')], text) if head else text
+                yield from csv.DictReader(lines)
+            
+            # urllib3 1.x does not enforce Content-Length, so a dropped
+            # connection would otherwise read as a short but valid CSV
+            remaining = getattr(response.raw, 'length_remaining', None)
+            if remaining:
+                raise IOError(f"CSV download ended {remaining} bytes short")
+        finally:
+            response.close()
+    
+    def _get_if_changed(self, url: str, checksum: str = None) -> Optional['requests.Response']:
+        """
+        Stream a corpus download unless it is unchanged since the last run.
+        
+        A matching Zenodo checksum skips the request entirely; otherwise the
+        cached ETag is sent so the server can answer 304 Not Modified.
+        """
+        cached = self.db.get_source_cache(url)
+        if cached and checksum and cached['checksum'] == checksum:
+            logger.info(f"{self.source_name}: {url} unchanged since last run - skipping")
+            return None
+        
+        headers = {'If-None-Match': cached['etag']} if cached and cached['etag'] else None
+        response = self.client.get(url, headers=headers, timeout=120, stream=True)
+        if response is not None and response.status_code == 304:
+            response.close()
+            logger.info(f"{self.source_name}: {url} not modified - skipping")
+            return None
+        return response
 
 # =============================================================================
 # WTO EXTRACTOR
 # =============================================================================
+DISPUTE_HREF_PAT = re.compile(r'ds', re.IGNORECASE)
+# 'united states' in any case, or the literal uppercase 'US'
+US_PAT = re.compile(r'(?i:united states)|US')
+
 class WTOExtractor(BaseExtractor):
     """Extractor for WTO data."""
     
@@ -545,45 +1070,54 @@ class WTOExtractor(BaseExtractor):
             'HS_X_0049',  # Books/publications exports
         ]
         
-        records = []
-        headers = {'Ocp-Apim-Subscription-Key': self.config.wto_api_key}
+        jobs = [(indicator, country)
+                for indicator in indicators
+                for country in self.config.countries_iso3]
         
-        for indicator in indicators:
-            for country in self.config.countries_iso3:
-                url = APIEndpoints.WTO_DATA
-                params = {
-                    'i': indicator,
-                    'r': country,
-                    'ps': f'{self.config.start_year}-{self.config.end_year}',
-                    'fmt': 'json',
-                    'mode': 'full'
-                }
-                
-                data = self.client.get_json(url, params=params, headers=headers)
-                
-                if data and 'Dataset' in data:
-                    for item in data['Dataset']:
-                        is_relevant, tags = self.is_culturally_relevant(
-                            item.get('ProductSector', '')
-                        )
-                        
-                        records.append({
-                            'indicator_code': indicator,
-                            'indicator_name': item.get('IndicatorName'),
-                            'reporter_code': item.get('ReportingEconomyCode'),
-                            'reporter_name': item.get('ReportingEconomy'),
-                            'partner_code': item.get('PartnerEconomyCode'),
-                            'product_code': item.get('ProductSectorCode'),
-                            'year': item.get('Year'),
-                            'value': item.get('Value'),
-                            'unit': item.get('Unit'),
-                            'relevance_tags': ','.join(tags) if tags else None
-                        })
+        records = []
+        with ThreadPoolExecutor(max_workers=self.config.max_workers) as executor:
+            for batch in executor.map(lambda job: self._fetch_trade_series(*job), jobs):
+                records.extend(batch)
         
         inserted = self.db.insert_many('wto_trade_data', records)
         logger.info(f"Inserted {inserted} WTO trade records")
         return inserted
     
+    def _fetch_trade_series(self, indicator: str, country: str) -> List[Dict]:
+        """Fetch one indicator/reporter series from the WTO API."""
+        url = APIEndpoints.WTO_DATA
+        headers = {'Ocp-Apim-Subscription-Key': self.config.wto_api_key}
+        params = {
+            'i': indicator,
+            'r': country,
+            'ps': f'{self.config.start_year}-{self.config.end_year}',
+            'fmt': 'json',
+            'mode': 'full'
+        }
+        
+        data = self.client.get_json(url, params=params, headers=headers)
+        
+        records = []
+        if data and 'Dataset' in data:
+            for item in data['Dataset']:
+                is_relevant, tags = self.is_culturally_relevant(
+                    item.get('ProductSector', '')
+                )
+                
+                records.append({
+                    'indicator_code': indicator,
+                    'indicator_name': item.get('IndicatorName'),
+                    'reporter_code': item.get('ReportingEconomyCode'),
+                    'reporter_name': item.get('ReportingEconomy'),
+                    'partner_code': item.get('PartnerEconomyCode'),
+                    'product_code': item.get('ProductSectorCode'),
+                    'year': item.get('Year'),
+                    'value': item.get('Value'),
+                    'unit': item.get('Unit'),
+                    'relevance_tags': ','.join(tags) if tags else None
+                })
+        return records
+    
     def _extract_disputes(self) -> int:
         """Extract WTO dispute data via web scraping."""
         if not BS4_AVAILABLE:
@@ -605,11 +1139,13 @@ class WTOExtractor(BaseExtractor):
         if not response:
             return 0
         
-        soup = BeautifulSoup(response.content, 'html.parser')
+        # Only dispute anchors are needed, so skip building the rest of the DOM
+        soup = BeautifulSoup(response.content, HTML_PARSER,
+                             parse_only=SoupStrainer('a', href=DISPUTE_HREF_PAT))
         
         # Find US section and extract dispute links
         # (WTO website structure varies - this is a simplified approach)
-        dispute_links = soup.find_all('a', href=lambda x: x and 'ds' in x.lower() if x else False)
+        dispute_links = soup.find_all('a')
         
         records = []
         for link in dispute_links[:50]:  # Limit to recent disputes
@@ -617,7 +1153,7 @@ class WTOExtractor(BaseExtractor):
             title = link.text.strip()
             
             # Check if US is involved
-            if 'united states' in title.lower() or 'US' in title:
+            if US_PAT.search(title):
                 is_relevant, tags = self.is_culturally_relevant(title)
                 
                 records.append({
@@ -630,8 +1166,25 @@ class WTOExtractor(BaseExtractor):
                 })
         
         inserted = self.db.insert_many('wto_disputes', records)
+        # Replace, not add to, the parties of re-extracted disputes
+        self.db.delete_many('wto_dispute_parties', 'dispute_number',
+                            {record['dispute_number'] for record in records})
+        self.db.insert_many('wto_dispute_parties', (
+            party for record in records for party in self._dispute_parties(record)
+        ))
         logger.info(f"Inserted {inserted} WTO disputes")
         return inserted
+    
+    @staticmethod
+    def _dispute_parties(record: Dict) -> Iterator[Tuple[str, str, str]]:
+        """Yield (party, role, dispute_number) rows, normalizing US party names."""
+        for role in ('complainant', 'respondent'):
+            for party in (record.get(role) or '').split(','):
+                party = party.strip()
+                if party:
+                    if 'united states' in party.lower():
+                        party = 'United States'
+                    yield (party, role, record['dispute_number'])
 
 # =============================================================================
 # IMF EXTRACTOR
@@ -666,11 +1219,17 @@ class IMFExtractor(BaseExtractor):
                 ]
             }
             
-            for dataset, ind_list in indicators.items():
-                for country in self.config.countries_iso2:
-                    for indicator_code, indicator_name in ind_list:
-                        records = self._fetch_series(dataset, country, indicator_code, indicator_name)
-                        total_records += records
+            jobs = [(dataset, country, indicator_code, indicator_name)
+                    for dataset, ind_list in indicators.items()
+                    for country in self.config.countries_iso2
+                    for indicator_code, indicator_name in ind_list]
+            
+            all_records = []
+            with ThreadPoolExecutor(max_workers=self.config.max_workers) as executor:
+                for records in executor.map(lambda job: self._fetch_series(*job), jobs):
+                    all_records.extend(records)
+            
+            total_records = self.db.insert_many('imf_economic_data', all_records)
             
             self.db.complete_extraction(log_id, total_records)
             
@@ -681,8 +1240,8 @@ class IMFExtractor(BaseExtractor):
         return {'source': 'IMF', 'records': total_records}
     
     def _fetch_series(self, dataset: str, country: str, 
-                     indicator: str, indicator_name: str) -> int:
-        """Fetch a time series from IMF API."""
+                     indicator: str, indicator_name: str) -> List[Dict]:
+        """Fetch a time series from IMF API and return its records."""
         url = f"{APIEndpoints.IMF_DATA}/{dataset}/A.{country}.{indicator}"
         
         params = {
@@ -690,20 +1249,13 @@ class IMFExtractor(BaseExtractor):
             'endPeriod': str(self.config.end_year)
         }
         
-        data = self.client.get_json(url, params=params)
-        
-        if not data:
-            return 0
-        
         records = []
         
         try:
-            compact_data = data.get('CompactData', {})
-            dataset_data = compact_data.get('DataSet', {})
-            series = dataset_data.get('Series', {})
-            
-            if isinstance(series, dict):
-                series = [series]
+            # Series arrive one at a time; a lone series is an object, not a list
+            series = self.client.iter_json_objects(
+                url, 'CompactData.DataSet.Series', params=params
+            )
             
             for s in series:
                 obs = s.get('Obs', [])
@@ -731,8 +1283,7 @@ class IMFExtractor(BaseExtractor):
         except Exception as e:
             logger.warning(f"Failed to parse IMF data: {e}")
         
-        inserted = self.db.insert_many('imf_economic_data', records)
-        return inserted
+        return records
 
 # =============================================================================
 # WORLD BANK EXTRACTOR
@@ -766,10 +1317,16 @@ class WorldBankExtractor(BaseExtractor):
                 'SH.XPD.CHEX.GD.ZS',    # Health expenditure % GDP
             ]
             
-            for indicator in indicators:
-                for country in self.config.countries_iso3:
-                    records = self._fetch_indicator(indicator, country)
-                    total_records += records
+            # One request covers every configured country for an indicator
+            countries = self.config.countries_iso3
+            
+            all_records = []
+            with ThreadPoolExecutor(max_workers=self.config.max_workers) as executor:
+                for records in executor.map(lambda ind: self._fetch_indicator(ind, countries),
+                                            indicators):
+                    all_records.extend(records)
+            
+            total_records = self.db.insert_many('world_bank_indicators', all_records)
             
             self.db.complete_extraction(log_id, total_records)
             
@@ -779,43 +1336,77 @@ class WorldBankExtractor(BaseExtractor):
         
         return {'source': 'World Bank', 'records': total_records}
     
-    def _fetch_indicator(self, indicator: str, country: str) -> int:
-        """Fetch indicator data from World Bank API."""
-        url = f"{APIEndpoints.WB_BASE}/country/{country}/indicator/{indicator}"
+    def _fetch_indicator(self, indicator: str, countries: List[str]) -> List[tuple]:
+        """Fetch indicator data for several countries from World Bank API."""
+        if not countries:
+            return []
+        
+        # The API takes semicolon-separated country codes in a single path
+        url = f"{APIEndpoints.WB_BASE}/country/{';'.join(countries)}/indicator/{indicator}"
         
         params = {
             'format': 'json',
             'date': f'{self.config.start_year}:{self.config.end_year}',
-            'per_page': 100
+            'per_page': 10000
         }
         
-        data = self.client.get_json(url, params=params)
-        
-        if not data or not isinstance(data, list) or len(data) < 2:
-            return 0
+        def fetch_page(page: int):
+            data = self.client.get_json(url, params={**params, 'page': page})
+            if not data or not isinstance(data, list) or len(data) < 2:
+                return None
+            return data
         
         records = []
-        
+        data = fetch_page(1)
+        if data is None:
+            return records
+        self._parse_indicator_page(indicator, data, records)
+        
+        # The first page says how many there are; fetch the rest together
+        pages = int((data[0] or {}).get('pages') or 1)
+        if pages > 1:
+            workers = min(self.config.max_workers, pages - 1)
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                for data in executor.map(fetch_page, range(2, pages + 1)):
+                    if data is not None:
+                        self._parse_indicator_page(indicator, data, records)
+        
+        return records
+    
+    def _parse_indicator_page(self, indicator: str, data: list, records: List[tuple]):
+        """Append one response page as tuples in world_bank_indicators column order."""
         for item in data[1] or []:
-            if item.get('value') is not None:
-                records.append({
-                    'indicator_code': indicator,
-                    'indicator_name': item.get('indicator', {}).get('value'),
-                    'country_code': item.get('countryiso3code'),
-                    'country_name': item.get('country', {}).get('value'),
-                    'year': int(item.get('date')) if item.get('date') else None,
-                    'value': float(item.get('value'))
-                })
-        
-        inserted = self.db.insert_many('world_bank_indicators', records)
-        return inserted
+            # Any field may be missing from a malformed item, so read with .get
+            value = item.get('value')
+            if value is None:
+                continue
+            ind = item.get('indicator')
+            country = item.get('country')
+            date = item.get('date')
+            records.append((
+                indicator,
+                ind.get('value') if ind else None,
+                item.get('countryiso3code'),
+                country.get('value') if country else None,
+                int(date) if date else None,
+                float(value),
+            ))
 
 # =============================================================================
 # UN EXTRACTOR
 # =============================================================================
+US_MENTION_PAT = re.compile(r'united states|america', re.IGNORECASE)
+
 class UNExtractor(BaseExtractor):
     """Extractor for UN data (UNSC Resolutions)."""
     
+    # Corpus columns read by _extract_from_zenodo
+    CSV_COLUMNS = (
+        'resolution_number', 'symbol', 'title', 'subject', 'date', 'adoption_date',
+        'vote_for', 'yes', 'vote_against', 'no', 'vote_abstain', 'abstain',
+        'topics', 'url',
+    )
+    
     @property
     def source_name(self) -> str:
         return 'UN'
@@ -871,25 +1462,23 @@ class UNExtractor(BaseExtractor):
         if not download_url:
             return 0
         
-        response = self.client.get(download_url, timeout=120)
+        response = self._get_if_changed(download_url, csv_file.get('checksum'))
         if not response:
             return 0
         
-        # Parse CSV
+        # Parse CSV as it downloads, flushing to the database in batches
+        inserted = 0
         records = []
-        content = response.content.decode('utf-8', errors='ignore')
-        reader = csv.DictReader(StringIO(content))
-        
-        for row in reader:
+        for row in self._read_csv_rows(response, self.CSV_COLUMNS):
             title = row.get('title', '')
             
             # Check US relevance
             us_relevance = None
-            if 'united states' in title.lower() or 'america' in title.lower():
+            if US_MENTION_PAT.search(title):
                 us_relevance = 'mentioned'
             
             # Check cultural relevance
-            is_relevant, tags = self.is_culturally_relevant(title + ' ' + row.get('subject', ''))
+            is_relevant, tags = self.is_culturally_relevant(title, row.get('subject'))
             
             records.append({
                 'resolution_number': row.get('resolution_number') or row.get('symbol'),
@@ -903,8 +1492,14 @@ class UNExtractor(BaseExtractor):
                 'cultural_relevance': ','.join(tags) if tags else None,
                 'document_url': row.get('url')
             })
+            
+            if len(records) >= CSV_BATCH_SIZE:
+                inserted += self.db.insert_many('unsc_resolutions', records)
+                records = []
         
-        inserted = self.db.insert_many('unsc_resolutions', records)
+        inserted += self.db.insert_many('unsc_resolutions', records)
+        # Reached only once _read_csv_rows has read the whole corpus cleanly
+        self.db.set_source_cache(download_url, csv_file.get('checksum'), response.headers.get('ETag'))
         logger.info(f"Inserted {inserted} UNSC resolutions")
         return inserted
     
@@ -919,9 +1514,18 @@ class UNExtractor(BaseExtractor):
 # =============================================================================
 # ICJ EXTRACTOR
 # =============================================================================
+US_NAME_PAT = re.compile(r'united states', re.IGNORECASE)
+
 class ICJExtractor(BaseExtractor):
     """Extractor for ICJ (International Court of Justice) data."""
     
+    # Corpus columns read by _extract_from_zenodo
+    CSV_COLUMNS = (
+        'case_number', 'id', 'case_name', 'title', 'case_type', 'type',
+        'applicant', 'respondent', 'date_filed', 'date_instituted', 'date_decided',
+        'status', 'subject_matter', 'subject', 'outcome', 'url',
+    )
+    
     @property
     def source_name(self) -> str:
         return 'ICJ'
@@ -974,32 +1578,29 @@ class ICJExtractor(BaseExtractor):
         if not download_url:
             return 0
         
-        response = self.client.get(download_url, timeout=120)
+        response = self._get_if_changed(download_url, csv_file.get('checksum'))
         if not response:
             return 0
         
+        inserted = 0
         records = []
-        content = response.content.decode('utf-8', errors='ignore')
-        reader = csv.DictReader(StringIO(content))
-        
-        for row in reader:
+        for row in self._read_csv_rows(response, self.CSV_COLUMNS):
             case_name = row.get('case_name', '') or row.get('title', '')
             applicant = row.get('applicant', '')
             respondent = row.get('respondent', '')
             
             # Check US involvement
             us_involvement = None
-            if 'united states' in (applicant + respondent + case_name).lower():
-                if 'united states' in applicant.lower():
-                    us_involvement = 'applicant'
-                elif 'united states' in respondent.lower():
-                    us_involvement = 'respondent'
-                else:
-                    us_involvement = 'mentioned'
+            if US_NAME_PAT.search(applicant):
+                us_involvement = 'applicant'
+            elif US_NAME_PAT.search(respondent):
+                us_involvement = 'respondent'
+            elif US_NAME_PAT.search(case_name):
+                us_involvement = 'mentioned'
             
             # Check cultural relevance
             subject = row.get('subject_matter', '') or row.get('subject', '')
-            is_relevant, tags = self.is_culturally_relevant(case_name + ' ' + subject)
+            is_relevant, tags = self.is_culturally_relevant(case_name, subject)
             
             records.append({
                 'case_number': row.get('case_number') or row.get('id'),
@@ -1016,14 +1617,22 @@ class ICJExtractor(BaseExtractor):
                 'outcome': row.get('outcome'),
                 'url': row.get('url')
             })
+            
+            if len(records) >= CSV_BATCH_SIZE:
+                inserted += self.db.insert_many('icj_cases', records)
+                records = []
         
-        inserted = self.db.insert_many('icj_cases', records)
+        inserted += self.db.insert_many('icj_cases', records)
+        # Reached only once _read_csv_rows has read the whole corpus cleanly
+        self.db.set_source_cache(download_url, csv_file.get('checksum'), response.headers.get('ETag'))
         logger.info(f"Inserted {inserted} ICJ cases")
         return inserted
 
 # =============================================================================
 # NATO EXTRACTOR
 # =============================================================================
+OFFICIAL_TEXTS_PAT = re.compile(r'official_texts')
+
 class NATOExtractor(BaseExtractor):
     """Extractor for NATO public documents."""
     
@@ -1037,8 +1646,8 @@ class NATOExtractor(BaseExtractor):
     
     def extract(self) -> Dict[str, Any]:
         """Extract NATO data via web scraping."""
-        if not BS4_AVAILABLE:
-            logger.warning("BeautifulSoup not available - skipping NATO")
+        if not (LXML_AVAILABLE or BS4_AVAILABLE):
+            logger.warning("Neither lxml nor BeautifulSoup available - skipping NATO")
             return {'source': 'NATO', 'records': 0}
         
         log_id = self.db.log_extraction(self.source_name, 'full')
@@ -1067,15 +1676,8 @@ class NATOExtractor(BaseExtractor):
         if not response:
             return 0
         
-        soup = BeautifulSoup(response.content, 'html.parser')
-        
         records = []
-        links = soup.find_all('a', href=lambda x: x and 'official_texts' in x if x else False)
-        
-        for link in links[:30]:
-            title = link.text.strip()
-            href = link.get('href', '')
-            
+        for title, href in self._communique_links(response.content)[:30]:
             # Check US relevance (always high for NATO)
             us_relevance = 'member_state'
             
@@ -1090,6 +1692,19 @@ class NATOExtractor(BaseExtractor):
         inserted = self.db.insert_many('nato_documents', records)
         logger.info(f"Inserted {inserted} NATO documents")
         return inserted
+    
+    def _communique_links(self, content: bytes) -> List[Tuple[str, str]]:
+        """Return (title, href) for each official_texts link, in page order."""
+        if LXML_AVAILABLE:
+            if not content.strip():
+                return []
+            tree = lxml_html.fromstring(content)
+            return [(a.text_content().strip(), a.get('href'))
+                    for a in tree.xpath("//a[contains(@href, 'official_texts')]")]
+        
+        soup = BeautifulSoup(content, HTML_PARSER,
+                             parse_only=SoupStrainer('a', href=OFFICIAL_TEXTS_PAT))
+        return [(a.text.strip(), a['href']) for a in soup.find_all('a')]
 
 # =============================================================================
 # MASTER EXTRACTOR
@@ -1126,76 +1741,90 @@ class MasterExtractor:
             Dictionary with extraction results.
         """
         sources = sources or list(self.extractors.keys())
-        results = {}
         
         logger.info(f"Starting extraction from: {', '.join(sources)}")
         
+        known = []
         for source in sources:
             if source not in self.extractors:
                 logger.warning(f"Unknown source: {source}")
                 continue
-            
-            logger.info(f"{'='*50}")
-            logger.info(f"EXTRACTING FROM {source.upper()}")
-            logger.info(f"{'='*50}")
-            
-            try:
-                result = self.extractors[source].extract()
-                results[source] = result
-                logger.info(f"Completed {source}: {result.get('records', 0)} records")
-            except Exception as e:
-                logger.error(f"Failed {source}: {e}")
-                results[source] = {'source': source, 'records': 0, 'error': str(e)}
+            known.append(source)
+        
+        # Each source has its own upstream and rate limiter, so they can run
+        # side by side; the shared DatabaseManager serializes the writes.
+        workers = max(1, min(self.config.source_workers, len(known)))
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            results = dict(zip(known, executor.map(self._extract_source, known)))
         
+        self.db.optimize()
         return results
     
+    def _extract_source(self, source: str) -> Dict[str, Any]:
+        """Run a single extractor, turning failures into an error result."""
+        logger.info(f"{'='*50}")
+        logger.info(f"EXTRACTING FROM {source.upper()}")
+        logger.info(f"{'='*50}")
+        
+        try:
+            result = self.extractors[source].extract()
+            logger.info(f"Completed {source}: {result.get('records', 0)} records")
+            return result
+        except Exception as e:
+            logger.error(f"Failed {source}: {e}")
+            return {'source': source, 'records': 0, 'error': str(e)}
+    
+    # Export queries as (table, filter), keyed as they appear in the
+    # Threat Tracker JSON; see _export_sql for the selected columns
+    US_RELEVANT_QUERIES = {
+        'wto_disputes': ('wto_disputes', "complainant = 'United States' OR respondent = 'United States'"),
+        'icj_cases': ('icj_cases', "us_involvement IS NOT NULL"),
+        'unsc_resolutions': ('unsc_resolutions', "us_relevance IS NOT NULL"),
+        'economic_data': ('imf_economic_data', "country_code = 'US' ORDER BY year DESC"),
+    }
+    CULTURALLY_RELEVANT_QUERIES = {
+        'wto_disputes': ('wto_disputes', "cultural_relevance IS NOT NULL"),
+        'icj_cases': ('icj_cases', "cultural_relevance IS NOT NULL"),
+        'unsc_resolutions': ('unsc_resolutions', "cultural_relevance IS NOT NULL"),
+    }
+    ECONOMIC_INDICATORS_QUERY = ('world_bank_indicators', "country_code = 'USA' ORDER BY year DESC")
+    
+    def _export_sql(self, table: str, where: str) -> str:
+        """Select a table's data columns only, leaving out the internal
+        id and extracted_at bookkeeping columns."""
+        return f"SELECT {', '.join(self.db.data_columns(table))} FROM {table} WHERE {where}"
+    
     def get_us_relevant_data(self) -> Dict[str, List[Dict]]:
         """Get all data specifically relevant to the United States."""
-        return {
-            'wto_disputes': self.db.query(
-                "SELECT * FROM wto_disputes WHERE complainant = 'United States' OR respondent = 'United States'"
-            ),
-            'icj_cases': self.db.query(
-                "SELECT * FROM icj_cases WHERE us_involvement IS NOT NULL"
-            ),
-            'unsc_resolutions': self.db.query(
-                "SELECT * FROM unsc_resolutions WHERE us_relevance IS NOT NULL"
-            ),
-            'economic_data': self.db.query(
-                "SELECT * FROM imf_economic_data WHERE country_code = 'US' ORDER BY year DESC"
-            ),
-        }
+        return {key: self.db.query(self._export_sql(*query))
+                for key, query in self.US_RELEVANT_QUERIES.items()}
     
     def get_culturally_relevant_data(self) -> Dict[str, List[Dict]]:
         """Get all data relevant to cultural/heritage concerns."""
-        return {
-            'wto_disputes': self.db.query(
-                "SELECT * FROM wto_disputes WHERE cultural_relevance IS NOT NULL"
-            ),
-            'icj_cases': self.db.query(
-                "SELECT * FROM icj_cases WHERE cultural_relevance IS NOT NULL"
-            ),
-            'unsc_resolutions': self.db.query(
-                "SELECT * FROM unsc_resolutions WHERE cultural_relevance IS NOT NULL"
-            ),
-        }
+        return {key: self.db.query(self._export_sql(*query))
+                for key, query in self.CULTURALLY_RELEVANT_QUERIES.items()}
     
     def export_for_threat_tracker(self, output_path: str = './exports/threat_tracker_data.json'):
-        """Export data formatted for the Threat Tracker application."""
+        """
+        Export data formatted for the Threat Tracker application.
+        
+        Row sets are streamed from the database straight into the file, so
+        memory stays bounded by one fetch batch rather than the whole export.
+        """
         Path(output_path).parent.mkdir(parents=True, exist_ok=True)
         
         data = {
             'extracted_at': datetime.now().isoformat(),
-            'us_relevant': self.get_us_relevant_data(),
-            'culturally_relevant': self.get_culturally_relevant_data(),
-            'economic_indicators': self.db.query(
-                "SELECT * FROM world_bank_indicators WHERE country_code = 'USA' ORDER BY year DESC"
-            ),
+            'us_relevant': {key: self.db.query_iter(self._export_sql(*query))
+                            for key, query in self.US_RELEVANT_QUERIES.items()},
+            'culturally_relevant': {key: self.db.query_iter(self._export_sql(*query))
+                                    for key, query in self.CULTURALLY_RELEVANT_QUERIES.items()},
+            'economic_indicators': self.db.query_iter(self._export_sql(*self.ECONOMIC_INDICATORS_QUERY)),
             'statistics': self._get_statistics()
         }
         
-        with open(output_path, 'w') as f:
-            json.dump(data, f, indent=2, default=str)
+        with open(output_path, 'wb') as f:
+            write_json(f, data)
         
         logger.info(f"Exported threat tracker data to {output_path}")
         return output_path
@@ -1207,12 +1836,12 @@ class MasterExtractor:
             'world_bank_indicators', 'unsc_resolutions', 'icj_cases', 'nato_documents'
         ]
         
-        stats = {}
-        for table in tables:
-            result = self.db.query(f"SELECT COUNT(*) as count FROM {table}")
-            stats[table] = result[0]['count'] if result else 0
-        
-        return stats
+        # One statement for all tables instead of a COUNT round-trip each
+        sql = " UNION ALL ".join(
+            f"SELECT '{table}' AS name, COUNT(*) AS count FROM {table}" for table in tables
+        )
+        counts = {row['name']: row['count'] for row in self.db.query(sql)}
+        return {table: counts.get(table, 0) for table in tables}
 
 # =============================================================================
 # COMMAND LINE INTERFACE
@@ -7,12 +7,53 @@ Designed for integration with The Culture Keepers Threat Tracker™.
 ================================================================================
 """
 
+import copy
 import sqlite3
 import json
+import os
+import queue
+import threading
+import time
+from contextlib import contextmanager
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
-from typing import Dict, List, Optional, Any
+from typing import Dict, Iterator, List, Optional, Any, Tuple
 from pathlib import Path
 
+from json_export import write_json
+
+
+class ConnectionPool:
+    """
+    Fixed-size pool of read-only SQLite connections to one database.
+    
+    Each connection is opened and tuned once, then checked out per query,
+    so independent queries can run on separate connections in parallel.
+    """
+    
+    def __init__(self, db_path: str, size: int, pragmas: str = ''):
+        self._pool: queue.Queue = queue.Queue(maxsize=size)
+        uri = Path(db_path).resolve().as_uri() + '?mode=ro'
+        for _ in range(size):
+            conn = sqlite3.connect(uri, uri=True, check_same_thread=False)
+            conn.row_factory = sqlite3.Row
+            conn.executescript(pragmas)
+            self._pool.put(conn)
+    
+    @contextmanager
+    def checkout(self) -> Iterator[sqlite3.Connection]:
+        """Borrow a connection, returning it to the pool afterwards."""
+        conn = self._pool.get()
+        try:
+            yield conn
+        finally:
+            self._pool.put(conn)
+    
+    def close(self):
+        """Close every pooled connection."""
+        while not self._pool.empty():
+            self._pool.get_nowait().close()
+
 
 class ObligationsDatabase:
     """
@@ -29,7 +70,18 @@ class ObligationsDatabase:
         results = db.search_cultural_issues('indigenous')
     """
     
-    def __init__(self, db_path: str = './data/intl_obligations.db'):
+    # Applied once to each pooled connection; the page cache stays warm
+    # across queries. (WAL journaling is set by the extractor that writes.)
+    PRAGMAS = (
+        "PRAGMA cache_size=-65536;"
+        "PRAGMA temp_store=MEMORY;"
+        "PRAGMA mmap_size=268435456;"
+    )
+    
+    # Read-only connections, and threads for running queries side by side
+    POOL_SIZE = 6
+    
+    def __init__(self, db_path: str = './data/intl_obligations.db', cache_ttl: float = 60.0):
         self.db_path = db_path
         
         if not Path(db_path).exists():
@@ -37,17 +89,165 @@ class ObligationsDatabase:
                 f"Database not found at {db_path}. "
                 "Run quick_start.py first to extract data."
             )
+        
+        self._pool = ConnectionPool(db_path, self.POOL_SIZE, self.PRAGMAS)
+        self._executor = ThreadPoolExecutor(max_workers=self.POOL_SIZE)
+        # Query results by (sql, params), each stored with the time it was
+        # read; the whole cache is dropped once the database file changes.
+        self.cache_ttl = cache_ttl
+        self._cache: Dict[Tuple[str, tuple], Tuple[float, Tuple[sqlite3.Row, ...]]] = {}
+        self._cache_lock = threading.Lock()
+        self._cache_snapshot = self._snapshot()
+        # Summaries built from several queries, by name, each stored with the
+        # snapshot it was computed at
+        self._summaries: Dict[str, Tuple[Tuple[int, ...], Dict[str, Any]]] = {}
+        # FTS5 indexes built by the extractor; older databases may lack them
+        self._fts_tables = {row['name'] for row in self._query(
+            "SELECT name FROM sqlite_master WHERE type = 'table' AND name GLOB '*_fts'"
+        )}
+        # Columns per table other than extracted_at, so row queries never read
+        # the extraction timestamp but keep id as each row's stable key
+        self._column_names: Dict[str, List[str]] = {}
+        for row in self._query("""
+            SELECT m.name AS tbl, p.name AS col
+            FROM sqlite_master m JOIN pragma_table_info(m.name) p
+            WHERE m.type = 'table' AND p.name != 'extracted_at'
+            ORDER BY m.name, p.cid
+        """):
+            self._column_names.setdefault(row['tbl'], []).append(row['col'])
+        self._columns = {table: ', '.join(cols) for table, cols in self._column_names.items()}
+        # Conditions selecting US disputes, for any role or the role bound as
+        # a parameter. Databases extracted before wto_dispute_parties existed
+        # cannot gain it through this read-only connection, so they keep the
+        # LIKE scans over complainant/respondent.
+        if 'wto_dispute_parties' in self._column_names:
+            self._us_wto_dispute_filter = {
+                role: f"""dispute_number IN (
+                    SELECT dispute_number FROM wto_dispute_parties
+                    WHERE party = 'United States'{role_filter}
+                )"""
+                for role, role_filter in (('any', ''), ('role', ' AND role = ?'))
+            }
+        else:
+            self._us_wto_dispute_filter = {
+                'any': "(complainant LIKE '%United States%' OR respondent LIKE '%United States%')",
+                'role': "CASE ? WHEN 'complainant' THEN complainant ELSE respondent END LIKE '%United States%'",
+            }
+        # Fixed statements for get_us_wto_disputes. The SQL text never
+        # varies, so each pooled connection prepares it once and reuses it
+        # from its statement cache.
+        self._us_wto_disputes_sql = {
+            role: f"""
+                SELECT {self._columns['wto_disputes']} FROM wto_disputes
+                WHERE {condition}
+                ORDER BY date_initiated DESC
+            """
+            for role, condition in self._us_wto_dispute_filter.items()
+        }
+    
+    def close(self):
+        """Close the pooled connections and worker threads."""
+        self._executor.shutdown()
+        self._pool.close()
+    
+    def _snapshot(self) -> Tuple[int, ...]:
+        """Modification times of the database and its WAL, to detect writes."""
+        snapshot = []
+        for path in (self.db_path, self.db_path + '-wal'):
+            try:
+                snapshot.append(os.stat(path).st_mtime_ns)
+            except FileNotFoundError:
+                snapshot.append(0)
+        return tuple(snapshot)
     
     def _query(self, sql: str, params: tuple = None) -> List[Dict]:
-        """Execute a query and return results as dictionaries."""
-        conn = sqlite3.connect(self.db_path)
-        conn.row_factory = sqlite3.Row
-        cursor = conn.cursor()
-        cursor.execute(sql, params or ())
-        columns = [d[0] for d in cursor.description]
-        results = [dict(zip(columns, row)) for row in cursor.fetchall()]
-        conn.close()
-        return results
+        """
+        Execute a query and return results as dictionaries.
+        
+        Results are cached for ``cache_ttl`` seconds as immutable rows; each
+        call builds its own dictionaries, so callers may modify them freely.
+        """
+        key = (sql, tuple(params or ()))
+        now = time.monotonic()
+        snapshot = self._snapshot()
+        with self._cache_lock:
+            if snapshot != self._cache_snapshot:
+                self._cache.clear()
+                self._cache_snapshot = snapshot
+            hit = self._cache.get(key)
+        if hit is not None and now - hit[0] < self.cache_ttl:
+            return [dict(row) for row in hit[1]]
+        
+        with self._pool.checkout() as conn:
+            rows = conn.execute(sql, key[1]).fetchall()
+        if self.cache_ttl > 0:
+            with self._cache_lock:
+                self._cache[key] = (now, tuple(rows))
+        return [dict(row) for row in rows]
+    
+    def _summary(self, name: str, build) -> Dict[str, Any]:
+        """
+        Return a copy of the summary ``build()`` computes, reusing the last
+        result until the database changes. Exceptions are never cached.
+        """
+        snapshot = self._snapshot()
+        with self._cache_lock:
+            hit = self._summaries.get(name)
+        if hit is None or hit[0] != snapshot:
+            hit = (snapshot, build())
+            if self.cache_ttl > 0:
+                with self._cache_lock:
+                    self._summaries[name] = hit
+        return copy.deepcopy(hit[1])
+    
+    def _json_object(self, table: str) -> str:
+        """SQL expression building a row's columns as a JSON object."""
+        return 'json_object(' + ', '.join(
+            f"'{col}', {col}" for col in self._column_names[table]
+        ) + ')'
+    
+    def _keyword_filter(self, table: str, columns: List[str], keyword: str) -> Tuple[str, tuple]:
+        """
+        Build a WHERE condition matching ``keyword`` in any of ``columns``.
+        
+        Uses the table's FTS5 index as a prefix match where one exists,
+        falling back to substring LIKE scans otherwise.
+        """
+        fts = f"{table}_fts"
+        if fts in self._fts_tables and keyword.strip():
+            phrase = '"' + keyword.replace('"', '""') + '"*'
+            return (f"id IN (SELECT rowid FROM {fts} WHERE {fts} MATCH ?)",
+                    (f"{{{' '.join(columns)}}} : {phrase}",))
+        # Escape LIKE wildcards so the keyword only ever matches literally
+        pattern = keyword.replace('\\', '\\\\').replace('%', '\\%').replace('_', '\\_')
+        conditions = ' OR '.join(f"{col} LIKE '%' || ? || '%' ESCAPE '\\'" for col in columns)
+        return f"({conditions})", (pattern,) * len(columns)
+    
+    def _iter_query(self, sql: str, params: tuple = None,
+                    batch_size: int = 1000) -> Iterator[sqlite3.Row]:
+        """
+        Yield rows, fetching ``batch_size`` at a time, so a result set never
+        has to be held in memory whole. Bypasses the cache.
+        """
+        with self._pool.checkout() as conn:
+            cursor = conn.execute(sql, params or ())
+            while True:
+                rows = cursor.fetchmany(batch_size)
+                if not rows:
+                    break
+                yield from rows
+    
+    def _query_many(self, queries: Dict[str, Any]) -> Dict[str, List[Dict]]:
+        """
+        Run independent queries concurrently, keyed like ``queries``.
+        
+        Each value is either an SQL string or an ``(sql, params)`` tuple.
+        """
+        futures = {}
+        for key, query in queries.items():
+            sql, params = (query, None) if isinstance(query, str) else query
+            futures[key] = self._executor.submit(self._query, sql, params)
+        return {key: future.result() for key, future in futures.items()}
     
     # =========================================================================
     # US-SPECIFIC QUERIES
@@ -60,25 +260,25 @@ class ObligationsDatabase:
         Args:
             role: Filter by 'complainant', 'respondent', or None for both
         """
-        sql = """
-            SELECT * FROM wto_disputes 
-            WHERE complainant LIKE '%United States%' 
-               OR respondent LIKE '%United States%'
-        """
-        if role == 'complainant':
-            sql = "SELECT * FROM wto_disputes WHERE complainant LIKE '%United States%'"
-        elif role == 'respondent':
-            sql = "SELECT * FROM wto_disputes WHERE respondent LIKE '%United States%'"
-        
-        return self._query(sql + " ORDER BY date_initiated DESC")
+        return self._query(*self._us_wto_disputes_query(role))
+    
+    def _us_wto_disputes_query(self, role: str = None) -> Tuple[str, tuple]:
+        """SQL and parameters behind get_us_wto_disputes."""
+        if role in ('complainant', 'respondent'):
+            return self._us_wto_disputes_sql['role'], (role,)
+        return self._us_wto_disputes_sql['any'], ()
     
     def get_us_icj_cases(self) -> List[Dict]:
         """Get ICJ cases involving the United States."""
-        return self._query("""
-            SELECT * FROM icj_cases 
+        return self._query(*self._us_icj_cases_query())
+    
+    def _us_icj_cases_query(self) -> Tuple[str, tuple]:
+        """SQL and parameters behind get_us_icj_cases."""
+        return f"""
+            SELECT {self._columns['icj_cases']} FROM icj_cases 
             WHERE us_involvement IS NOT NULL
             ORDER BY date_filed DESC
-        """)
+        """, ()
     
     def get_us_economic_indicators(self, indicator: str = None) -> List[Dict]:
         """
@@ -87,25 +287,33 @@ class ObligationsDatabase:
         Args:
             indicator: Specific indicator code, or None for all
         """
-        sql = "SELECT * FROM imf_economic_data WHERE country_code = 'US'"
+        return self._query(*self._us_economic_indicators_query(indicator))
+    
+    def _us_economic_indicators_query(self, indicator: str = None) -> Tuple[str, tuple]:
+        """SQL and parameters behind get_us_economic_indicators."""
+        sql = f"SELECT {self._columns['imf_economic_data']} FROM imf_economic_data WHERE country_code = 'US'"
         params = ()
         
         if indicator:
             sql += " AND indicator_code = ?"
             params = (indicator,)
         
-        return self._query(sql + " ORDER BY year DESC", params)
+        return sql + " ORDER BY year DESC", params
     
     def get_us_world_bank_data(self, indicator: str = None) -> List[Dict]:
         """Get World Bank indicators for the US."""
-        sql = "SELECT * FROM world_bank_indicators WHERE country_code = 'USA'"
+        return self._query(*self._us_world_bank_data_query(indicator))
+    
+    def _us_world_bank_data_query(self, indicator: str = None) -> Tuple[str, tuple]:
+        """SQL and parameters behind get_us_world_bank_data."""
+        sql = f"SELECT {self._columns['world_bank_indicators']} FROM world_bank_indicators WHERE country_code = 'USA'"
         params = ()
         
         if indicator:
             sql += " AND indicator_code = ?"
             params = (indicator,)
         
-        return self._query(sql + " ORDER BY year DESC", params)
+        return sql + " ORDER BY year DESC", params
     
     # =========================================================================
     # CULTURAL/HERITAGE QUERIES
@@ -121,39 +329,43 @@ class ObligationsDatabase:
         Returns:
             Dictionary with results from each source
         """
-        results = {}
-        
-        # WTO disputes
-        sql = "SELECT * FROM wto_disputes WHERE cultural_relevance IS NOT NULL"
-        if keyword:
-            sql += f" AND (title LIKE '%{keyword}%' OR subject_matter LIKE '%{keyword}%')"
-        results['wto_disputes'] = self._query(sql)
-        
-        # ICJ cases
-        sql = "SELECT * FROM icj_cases WHERE cultural_relevance IS NOT NULL"
-        if keyword:
-            sql += f" AND (case_name LIKE '%{keyword}%' OR subject_matter LIKE '%{keyword}%')"
-        results['icj_cases'] = self._query(sql)
+        return self._query_many(self._cultural_issues_queries(keyword))
+    
+    def _cultural_issues_queries(self, keyword: str = None) -> Dict[str, Tuple[str, tuple]]:
+        """Per-source queries behind search_cultural_issues."""
+        # Keyword filters are bound as parameters, never spliced into the SQL
+        searched_columns = {
+            'wto_disputes': ('title', 'subject_matter'),
+            'icj_cases': ('case_name', 'subject_matter'),
+            'unsc_resolutions': ('title', 'topics'),
+        }
         
-        # UNSC resolutions
-        sql = "SELECT * FROM unsc_resolutions WHERE cultural_relevance IS NOT NULL"
-        if keyword:
-            sql += f" AND (title LIKE '%{keyword}%' OR topics LIKE '%{keyword}%')"
-        results['unsc_resolutions'] = self._query(sql)
+        queries = {}
+        for table, columns in searched_columns.items():
+            sql = f"SELECT {self._columns[table]} FROM {table} WHERE cultural_relevance IS NOT NULL"
+            params = ()
+            if keyword:
+                condition, params = self._keyword_filter(table, columns, keyword)
+                sql += " AND " + condition
+            queries[table] = (sql, params)
         
-        return results
+        return queries
     
     def get_environmental_obligations(self) -> Dict[str, List[Dict]]:
         """Get data related to environmental obligations."""
+        return self._query_many(self._environmental_queries())
+    
+    def _environmental_queries(self) -> Dict[str, str]:
+        """Per-source queries behind get_environmental_obligations."""
         return {
-            'unsc_resolutions': self._query("""
-                SELECT * FROM unsc_resolutions 
+            'unsc_resolutions': f"""
+                SELECT {self._columns['unsc_resolutions']} FROM unsc_resolutions 
                 WHERE cultural_relevance LIKE '%environment%'
                    OR cultural_relevance LIKE '%climate%'
                    OR cultural_relevance LIKE '%conservation%'
-            """),
-            'world_bank': self._query("""
-                SELECT * FROM world_bank_indicators 
+            """,
+            'world_bank': f"""
+                SELECT {self._columns['world_bank_indicators']} FROM world_bank_indicators 
                 WHERE indicator_code IN (
                     'EN.ATM.CO2E.PC',
                     'ER.PTD.TOTL.ZS',
@@ -161,11 +373,15 @@ class ObligationsDatabase:
                 )
                 AND country_code = 'USA'
                 ORDER BY year DESC
-            """)
+            """
         }
     
     def get_indigenous_issues(self) -> Dict[str, List[Dict]]:
         """Get data related to indigenous peoples and tribal issues."""
+        return self._query_many(self._indigenous_queries())
+    
+    def _indigenous_queries(self) -> Dict[str, str]:
+        """Per-source queries behind get_indigenous_issues."""
         keyword_search = """
             cultural_relevance LIKE '%indigenous%'
             OR cultural_relevance LIKE '%tribal%'
@@ -173,12 +389,12 @@ class ObligationsDatabase:
         """
         
         return {
-            'icj_cases': self._query(f"""
-                SELECT * FROM icj_cases WHERE {keyword_search}
-            """),
-            'unsc_resolutions': self._query(f"""
-                SELECT * FROM unsc_resolutions WHERE {keyword_search}
-            """)
+            'icj_cases': f"""
+                SELECT {self._columns['icj_cases']} FROM icj_cases WHERE {keyword_search}
+            """,
+            'unsc_resolutions': f"""
+                SELECT {self._columns['unsc_resolutions']} FROM unsc_resolutions WHERE {keyword_search}
+            """
         }
     
     # =========================================================================
@@ -194,21 +410,21 @@ class ObligationsDatabase:
         """
         # Note: Date filtering depends on data availability
         return {
-            'icj_cases': self._query("""
-                SELECT * FROM icj_cases 
+            'icj_cases': self._query(f"""
+                SELECT {self._columns['icj_cases']} FROM icj_cases 
                 WHERE date_filed >= date('now', '-1 year')
                    OR date_decided >= date('now', '-1 year')
                 ORDER BY COALESCE(date_decided, date_filed) DESC
                 LIMIT 20
             """),
-            'unsc_resolutions': self._query("""
-                SELECT * FROM unsc_resolutions
+            'unsc_resolutions': self._query(f"""
+                SELECT {self._columns['unsc_resolutions']} FROM unsc_resolutions
                 WHERE date_adopted >= date('now', '-1 year')
                 ORDER BY date_adopted DESC
                 LIMIT 50
             """),
-            'nato_documents': self._query("""
-                SELECT * FROM nato_documents
+            'nato_documents': self._query(f"""
+                SELECT {self._columns['nato_documents']} FROM nato_documents
                 WHERE date_published >= date('now', '-1 year')
                 ORDER BY date_published DESC
                 LIMIT 20
@@ -221,6 +437,9 @@ class ObligationsDatabase:
     
     def get_database_summary(self) -> Dict[str, Any]:
         """Get a summary of all data in the database."""
+        return self._summary('database', self._build_database_summary)
+    
+    def _build_database_summary(self) -> Dict[str, Any]:
         tables = {
             'wto_trade_data': 'WTO Trade Data',
             'wto_disputes': 'WTO Disputes',
@@ -238,21 +457,39 @@ class ObligationsDatabase:
             'culturally_relevant': {}
         }
         
+        # Tables search_cultural_issues covers
+        cultural_tables = ('wto_disputes', 'icj_cases', 'unsc_resolutions')
+        
+        # Every count comes back from one UNION ALL statement, as (key, c) rows
+        counts = [
+            (f"table:{table}", f"SELECT COUNT(*) FROM {table}") for table in tables
+        ] + [
+            ('us:wto_disputes',
+             f"SELECT COUNT(*) FROM wto_disputes WHERE {self._us_wto_dispute_filter['any']}"),
+            ('us:icj_cases', "SELECT COUNT(*) FROM icj_cases WHERE us_involvement IS NOT NULL"),
+        ] + [
+            (f"cultural:{table}", f"SELECT COUNT(*) FROM {table} WHERE cultural_relevance IS NOT NULL")
+            for table in cultural_tables
+        ]
+        rows = self._query(' UNION ALL '.join(
+            f"SELECT '{key}' AS key, ({sql}) AS c" for key, sql in counts
+        ))
+        by_key = {row['key']: row['c'] for row in rows}
+        
         for table, name in tables.items():
-            count = self._query(f"SELECT COUNT(*) as c FROM {table}")[0]['c']
+            count = by_key[f"table:{table}"]
             summary['tables'][table] = {'name': name, 'count': count}
             summary['total_records'] += count
         
         # US-specific counts
         summary['us_specific'] = {
-            'wto_disputes': len(self.get_us_wto_disputes()),
-            'icj_cases': len(self.get_us_icj_cases()),
+            'wto_disputes': by_key['us:wto_disputes'],
+            'icj_cases': by_key['us:icj_cases'],
         }
         
         # Culturally relevant counts
-        cultural = self.search_cultural_issues()
         summary['culturally_relevant'] = {
-            k: len(v) for k, v in cultural.items()
+            table: by_key[f"cultural:{table}"] for table in cultural_tables
         }
         
         return summary
@@ -273,24 +510,31 @@ class ObligationsDatabase:
         
         Path(output_path).parent.mkdir(parents=True, exist_ok=True)
         
+        # Row sets are generators, written out one row at a time
+        def stream(queries: Dict[str, Any]) -> Dict[str, Iterator[sqlite3.Row]]:
+            return {
+                key: self._iter_query(*((query, None) if isinstance(query, str) else query))
+                for key, query in queries.items()
+            }
+        
         data = {
             'exported_at': datetime.now().isoformat(),
             'summary': self.get_database_summary(),
             'us_obligations': {
-                'wto_disputes': self.get_us_wto_disputes(),
-                'icj_cases': self.get_us_icj_cases(),
+                'wto_disputes': self._iter_query(*self._us_wto_disputes_query()),
+                'icj_cases': self._iter_query(*self._us_icj_cases_query()),
             },
-            'cultural_heritage': self.search_cultural_issues(),
-            'environmental': self.get_environmental_obligations(),
-            'indigenous': self.get_indigenous_issues(),
+            'cultural_heritage': stream(self._cultural_issues_queries()),
+            'environmental': stream(self._environmental_queries()),
+            'indigenous': stream(self._indigenous_queries()),
             'economic_indicators': {
-                'imf': self.get_us_economic_indicators(),
-                'world_bank': self.get_us_world_bank_data()
+                'imf': self._iter_query(*self._us_economic_indicators_query()),
+                'world_bank': self._iter_query(*self._us_world_bank_data_query())
             }
         }
         
-        with open(output_path, 'w') as f:
-            json.dump(data, f, indent=2, default=str)
+        with open(output_path, 'wb') as f:
+            write_json(f, data)
         
         return output_path
 
@@ -299,6 +543,22 @@ class ObligationsDatabase:
 # CONVENIENCE FUNCTIONS
 # =============================================================================
 
+_db: Optional[ObligationsDatabase] = None
+_db_lock = threading.Lock()
+
+
+def _get_db() -> ObligationsDatabase:
+    """
+    Return the shared database used by the convenience functions, opening it
+    on first use so repeated calls reuse its connection pool and cache.
+    """
+    global _db
+    with _db_lock:
+        if _db is None:
+            _db = ObligationsDatabase()
+        return _db
+
+
 def get_threat_summary() -> Dict:
     """
     Quick function to get a threat summary for the dashboard.
@@ -307,17 +567,21 @@ def get_threat_summary() -> Dict:
         Dictionary with key threat indicators
     """
     try:
-        db = ObligationsDatabase()
+        db = _get_db()
     except FileNotFoundError:
         return {'error': 'Database not found. Run extraction first.'}
     
+    return db._summary('threat', lambda: _build_threat_summary(db))
+
+
+def _build_threat_summary(db: ObligationsDatabase) -> Dict:
     us_disputes = db.get_us_wto_disputes()
     us_cases = db.get_us_icj_cases()
     cultural = db.search_cultural_issues()
     
     # Count active threats
-    active_disputes = len([d for d in us_disputes if d.get('status') != 'concluded'])
-    active_cases = len([c for c in us_cases if c.get('status') not in ['concluded', 'decided']])
+    active_disputes = len([d for d in us_disputes if d['status'] != 'concluded'])
+    active_cases = len([c for c in us_cases if c['status'] not in ['concluded', 'decided']])
     
     return {
         'wto_active_disputes': active_disputes,
@@ -337,10 +601,11 @@ def search_all(keyword: str) -> Dict[str, List[Dict]]:
         keyword: Term to search for
     
     Returns:
-        Dictionary with results from each source
+        Dictionary with results from each source, rows as plain dicts
+        ready for JSON responses
     """
     try:
-        db = ObligationsDatabase()
+        db = _get_db()
     except FileNotFoundError:
         return {'error': 'Database not found. Run extraction first.'}
     
@@ -354,10 +619,20 @@ def search_all(keyword: str) -> Dict[str, List[Dict]]:
         'nato_documents': ['title', 'summary']
     }
     
+    # One statement covers every table: each branch tags its rows with the
+    # source table, and SQLite builds the rows as JSON objects itself
+    branches = []
+    params = []
     for table, columns in tables_and_columns.items():
-        conditions = ' OR '.join([f"{col} LIKE '%{keyword}%'" for col in columns])
-        sql = f"SELECT * FROM {table} WHERE {conditions}"
-        results[table] = db._query(sql)
+        condition, table_params = db._keyword_filter(table, columns, keyword)
+        branches.append(
+            f"SELECT '{table}' AS src, {db._json_object(table)} AS data FROM {table} WHERE {condition}"
+        )
+        params.extend(table_params)
+        results[table] = []
+    
+    for row in db._query(' UNION ALL '.join(branches), tuple(params)):
+        results[row['src']].append(json.loads(row['data']))
     
     return results
 
@@ -12,7 +12,7 @@ Usage:
     python quick_start.py --export     # Extract and export for Threat Tracker
 
 Requirements:
-    pip install requests beautifulsoup4
+    pip install requests beautifulsoup4 lxml
 
 Optional (for WTO trade data):
     export WTO_API_KEY="your-api-key"